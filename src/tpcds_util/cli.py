@@ -3,16 +3,33 @@
 from pathlib import Path
 
 import click
-import yaml
-from rich.console import Console
-from rich.table import Table
 
 from .config import config_manager
-from .database import db_manager
-from .generator import DataGenerator
-from .loader import DataLoader
+from .ui import get_console
 
-console = Console()
+# Heavy dependencies (rich, oracledb via .database, the generator and loader)
+# are imported inside the commands that need them so that `--help` and the
+# config commands start quickly.
+
+# Larger results are truncated in Rich tables; use --raw to see every row
+MAX_RICH_ROWS = 200
+
+TABLE_INFO_COLUMNS = ("Table Name", "Rows", "Blocks", "Avg Row Length")
+
+
+def _ok(message):
+    """Print a success banner."""
+    click.secho(f"✅ {message}", fg="green")
+
+
+def _warn(message):
+    """Print a warning banner."""
+    click.secho(f"⚠️  {message}", fg="yellow")
+
+
+def _err(message):
+    """Print a failure banner to stderr."""
+    click.secho(f"❌ {message}", fg="red", err=True)
 
 
 @click.group()
@@ -35,6 +52,8 @@ def config():
 @config.command("show")
 def config_show():
     """Show current configuration."""
+    from rich.table import Table
+
     cfg = config_manager.load()
 
     table = Table(title="TPC-DS Utility Configuration")
@@ -53,8 +72,11 @@ def config_show():
     table.add_row("Default Scale", str(cfg.default_scale))
     table.add_row("Output Directory", cfg.default_output_dir)
     table.add_row("Parallel Workers", str(cfg.parallel_workers))
+    table.add_row(
+        "Metadata Optimizer Hints", "On" if cfg.metadata_optimizer_hints else "Off"
+    )
 
-    console.print(table)
+    get_console().print(table)
 
 
 @config.command("set")
@@ -68,6 +90,11 @@ def config_show():
 @click.option("--default-scale", type=int, help="Default scale factor")
 @click.option("--output-dir", help="Default output directory")
 @click.option("--parallel-workers", type=int, help="Number of parallel workers")
+@click.option(
+    "--metadata-optimizer-hints/--no-metadata-optimizer-hints",
+    default=None,
+    help="Apply optimizer session hints for table metadata queries",
+)
 def config_set(**kwargs):
     """Set configuration values."""
     # Filter out None values
@@ -78,7 +105,7 @@ def config_set(**kwargs):
         return
 
     config_manager.update(**updates)
-    console.print("✅ Configuration updated successfully", style="green")
+    _ok("Configuration updated successfully")
 
 
 @config.command("init")
@@ -117,7 +144,7 @@ def config_init():
         parallel_workers=workers,
     )
 
-    console.print("✅ Configuration initialized successfully", style="green")
+    _ok("Configuration initialized successfully")
 
 
 @cli.group()
@@ -129,12 +156,14 @@ def db():
 @db.command("test")
 def db_test():
     """Test database connection."""
-    console.print("Testing database connection...")
+    from .database import db_manager
+
+    click.echo("Testing database connection...")
 
     if db_manager.test_connection():
-        console.print("✅ Database connection successful", style="green")
+        _ok("Database connection successful")
     else:
-        console.print("❌ Database connection failed", style="red")
+        _err("Database connection failed")
         click.echo(
             "Please check your configuration with 'tpcds-util config show'", err=True
         )
@@ -142,38 +171,62 @@ def db_test():
 
 @db.command("info")
 @click.option("--schema", help="Target schema name (overrides config)")
-def db_info(schema):
+@click.option("--raw", is_flag=True, help="Print all rows as plain tab-separated text")
+def db_info(schema, raw):
     """Show database table information.
 
     Shows TPC-DS tables from your current user's schema by default.
     Use --schema to query a different schema.
     """
-    tables = db_manager.get_table_info(schema)
-
-    if not tables:
-        schema_msg = f" in schema {schema}" if schema else ""
-        console.print(
-            f"No TPC-DS tables found{schema_msg}. Create schema first with 'tpcds-util schema create'",
-            style="yellow",
-        )
-        return
-
-    schema_title = f"TPC-DS Tables{' (Schema: ' + schema + ')' if schema else ''}"
-    table = Table(title=schema_title)
-    table.add_column("Table Name", style="cyan")
-    table.add_column("Rows", justify="right", style="green")
-    table.add_column("Blocks", justify="right")
-    table.add_column("Avg Row Length", justify="right")
+    from .database import db_manager
 
-    for t in tables:
-        table.add_row(
+    rows = (
+        (
             t["TABLE_NAME"],
             str(t["NUM_ROWS"]) if t["NUM_ROWS"] else "0",
             str(t["BLOCKS"]) if t["BLOCKS"] else "0",
             str(t["AVG_ROW_LEN"]) if t["AVG_ROW_LEN"] else "0",
         )
+        for t in db_manager.iter_table_info(schema)
+    )
 
-    console.print(table)
+    row_count = 0
+    if raw:
+        for row in rows:
+            if not row_count:
+                click.echo("\t".join(TABLE_INFO_COLUMNS))
+            click.echo("\t".join(row))
+            row_count += 1
+    else:
+        from rich.table import Table
+
+        schema_title = f"TPC-DS Tables{' (Schema: ' + schema + ')' if schema else ''}"
+        table = Table(title=schema_title)
+        table.add_column("Table Name", style="cyan")
+        table.add_column("Rows", justify="right", style="green")
+        table.add_column("Blocks", justify="right")
+        table.add_column("Avg Row Length", justify="right")
+
+        # Rich table rendering cost grows with the row count, so cap it
+        for row in rows:
+            if row_count < MAX_RICH_ROWS:
+                table.add_row(*row)
+            row_count += 1
+
+        if row_count > MAX_RICH_ROWS:
+            table.add_row(
+                f"... {row_count - MAX_RICH_ROWS} more rows (use --raw to see all)"
+            )
+
+    if not row_count:
+        schema_msg = f" in schema {schema}" if schema else ""
+        _warn(
+            f"No TPC-DS tables found{schema_msg}. Create schema first with 'tpcds-util schema create'"
+        )
+        return
+
+    if not raw:
+        get_console().print(table)
 
 
 @cli.group()
@@ -200,12 +253,14 @@ def schema_create(schema_file, schema):
       tpcds-util schema create                    # Use current user's schema
       tpcds-util schema create --schema TPCDSV1  # Use specific schema (needs privileges)
     """
+    from .database import db_manager
+
     schema_path = Path(schema_file) if schema_file else None
 
     if db_manager.create_schema(schema_path, schema):
-        console.print("✅ Schema created successfully", style="green")
+        _ok("Schema created successfully")
     else:
-        console.print("❌ Schema creation failed", style="red")
+        _err("Schema creation failed")
 
 
 @schema.command("drop")
@@ -226,10 +281,12 @@ def schema_drop(confirm, schema):
       tpcds-util schema drop                      # Drop tables from current user's schema
       tpcds-util schema drop --schema TPCDSV1    # Drop tables from specific schema (needs privileges)
     """
+    from .database import db_manager
+
     if db_manager.drop_schema(confirm, schema):
-        console.print("✅ TPC-DS tables dropped successfully", style="green")
+        _ok("TPC-DS tables dropped successfully")
     else:
-        console.print("❌ TPC-DS tables drop failed", style="red")
+        _err("TPC-DS tables drop failed")
 
 
 @schema.group()
@@ -258,13 +315,15 @@ def user_create(username, password, tablespace):
       tpcds-util schema user create sales              # Creates 'sales' user (prompts for password)
       tpcds-util schema user create sales --password mypass123  # Creates with specified password
     """
+    from .database import db_manager
+
     if not password:
         password = click.prompt(f"Password for user '{username}'", hide_input=True)
 
     if db_manager.create_user(username, password, tablespace):
-        console.print(f"✅ User '{username}' created successfully", style="green")
+        _ok(f"User '{username}' created successfully")
     else:
-        console.print(f"❌ Failed to create user '{username}'", style="red")
+        _err(f"Failed to create user '{username}'")
 
 
 @user.command("restrict")
@@ -281,16 +340,16 @@ def user_restrict(username):
     Examples:
       tpcds-util schema user restrict sales    # Remove dangerous privileges from sales user
     """
+    from .database import db_manager
+
     if db_manager.restrict_user_privileges(username):
-        console.print(f"✅ User '{username}' privileges restricted", style="green")
-        console.print("   Removed dangerous system privileges", style="dim")
-        console.print(
-            "   User can still modify their own tables (Oracle limitation)", style="dim"
+        _ok(f"User '{username}' privileges restricted")
+        click.secho("   Removed dangerous system privileges", dim=True)
+        click.secho(
+            "   User can still modify their own tables (Oracle limitation)", dim=True
         )
     else:
-        console.print(
-            f"❌ Failed to restrict user '{username}' privileges", style="red"
-        )
+        _err(f"Failed to restrict user '{username}' privileges")
 
 
 @schema.command("copy")
@@ -314,6 +373,8 @@ def schema_copy(source_schema, target_schema, tables, structure_only):
       tpcds-util schema copy SYSTEM sales --tables store_sales,web_sales,catalog_sales  # Copy specific tables
       tpcds-util schema copy SYSTEM sales --structure-only   # Copy table structures only (no data)
     """
+    from .database import db_manager
+
     # By default, copy data unless --structure-only is specified
     include_data = not structure_only
 
@@ -323,15 +384,9 @@ def schema_copy(source_schema, target_schema, tables, structure_only):
 
     if db_manager.copy_schema(source_schema, target_schema, table_list, include_data):
         action = "structure" if structure_only else "tables and data"
-        console.print(
-            f"✅ Successfully copied {action} from '{source_schema}' to '{target_schema}'",
-            style="green",
-        )
+        _ok(f"Successfully copied {action} from '{source_schema}' to '{target_schema}'")
     else:
-        console.print(
-            f"❌ Failed to copy from '{source_schema}' to '{target_schema}'",
-            style="red",
-        )
+        _err(f"Failed to copy from '{source_schema}' to '{target_schema}'")
 
 
 @cli.group()
@@ -348,12 +403,14 @@ def generate():
 @click.option("--parallel", type=int, help="Parallel workers (default from config)")
 def generate_data(scale, output_dir, parallel):
     """Generate synthetic TPC-DS data files."""
+    from .generator import DataGenerator
+
     generator = DataGenerator()
 
     if generator.generate_data(scale, output_dir, parallel):
-        console.print("✅ Data generation completed", style="green")
+        _ok("Data generation completed")
     else:
-        console.print("❌ Data generation failed", style="red")
+        _err("Data generation failed")
 
 
 @cli.group()
@@ -383,12 +440,14 @@ def load_data(data_dir, parallel, table, schema):
       tpcds-util load data --schema TPCDSV1      # Load into specific schema (needs privileges)
       tpcds-util load data --table store_sales   # Load specific table only
     """
+    from .loader import DataLoader
+
     loader = DataLoader()
 
     if loader.load_data(data_dir, parallel, table, schema):
-        console.print("✅ Data loading completed", style="green")
+        _ok("Data loading completed")
     else:
-        console.print("❌ Data loading failed", style="red")
+        _err("Data loading failed")
 
 
 @load.command("truncate")
@@ -403,39 +462,50 @@ def truncate_data(confirm, schema):
     Truncates tables in your current user's schema by default.
     Use --schema to target a different schema (requires database privileges).
     """
+    from .loader import DataLoader
+
     loader = DataLoader()
 
     if loader.truncate_tables(confirm, schema):
-        console.print("✅ Data truncation completed", style="green")
+        _ok("Data truncation completed")
     else:
-        console.print("❌ Data truncation failed", style="red")
+        _err("Data truncation failed")
 
 
 @cli.command("status")
 def status():
     """Show overall system status."""
-    console.print("TPC-DS Utility Status", style="bold blue")
-    console.print()
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .database import db_manager
+
+    click.secho("TPC-DS Utility Status", fg="blue", bold=True)
+    click.echo()
 
     # Configuration status
     cfg = config_manager.load()
     if cfg.database.username:
-        console.print("✅ Configuration: Complete", style="green")
+        _ok("Configuration: Complete")
     else:
-        console.print("⚠️  Configuration: Incomplete", style="yellow")
+        _warn("Configuration: Incomplete")
+
+    # Both probes take their own pooled session, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        connected = executor.submit(db_manager.test_connection)
+        table_info = executor.submit(db_manager.get_table_info)
 
     # Database connection
-    if db_manager.test_connection():
-        console.print("✅ Database: Connected", style="green")
+    if connected.result():
+        _ok("Database: Connected")
     else:
-        console.print("❌ Database: Connection failed", style="red")
+        click.secho("❌ Database: Connection failed", fg="red")
 
     # Schema status
-    tables = db_manager.get_table_info()
+    tables = table_info.result()
     if tables:
-        console.print(f"✅ Schema: {len(tables)} tables found", style="green")
+        _ok(f"Schema: {len(tables)} tables found")
     else:
-        console.print("⚠️  Schema: No tables found", style="yellow")
+        _warn("Schema: No tables found")
 
 
 def main():
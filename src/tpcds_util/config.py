@@ -40,6 +40,7 @@ class TPCDSConfig:
     default_scale: int = 1
     default_output_dir: str = "./tpcds_data"
     parallel_workers: int = 4
+    metadata_optimizer_hints: bool = False  # Session hints for metadata queries
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -57,6 +58,7 @@ class TPCDSConfig:
             default_scale=data.get("default_scale", 1),
             default_output_dir=data.get("default_output_dir", "./tpcds_data"),
             parallel_workers=data.get("parallel_workers", 4),
+            metadata_optimizer_hints=data.get("metadata_optimizer_hints", False),
         )
 
 
@@ -66,6 +68,7 @@ class ConfigManager:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or self._get_default_config_path()
         self._config: Optional[TPCDSConfig] = None
+        self._password: Optional[str] = None
 
     def _get_default_config_path(self) -> Path:
         """Get default configuration file path."""
@@ -114,6 +117,7 @@ class ConfigManager:
         for key in ["host", "port", "service_name", "username", "password", "use_sid"]:
             if key in kwargs and kwargs[key] is not None:
                 setattr(config.database, key, kwargs[key])
+                self.clear_password()  # Re-resolve for the new settings
 
         # Update main config
         for key in [
@@ -121,6 +125,7 @@ class ConfigManager:
             "default_scale",
             "default_output_dir",
             "parallel_workers",
+            "metadata_optimizer_hints",
         ]:
             if key in kwargs and kwargs[key] is not None:
                 setattr(config, key, kwargs[key])
@@ -132,20 +137,27 @@ class ConfigManager:
         self.save()
 
     def get_password(self) -> str:
-        """Get password from environment or prompt."""
-        config = self.load()
+        """Get password from environment or prompt.
+
+        The resolved password is cached so the user is prompted at most once
+        per process; updating the database settings clears it.
+        """
+        if self._password is not None:
+            return self._password
 
-        # Try environment variable first
-        password = os.getenv("TPCDS_DB_PASSWORD")
-        if password:
-            return password
+        config = self.load()
 
-        # Try config file
-        if config.database.password:
-            return config.database.password
+        # Try environment variable first, then config file, then prompt user
+        self._password = (
+            os.getenv("TPCDS_DB_PASSWORD")
+            or config.database.password
+            or click.prompt("Database password", hide_input=True)
+        )
+        return self._password
 
-        # Prompt user
-        return click.prompt("Database password", hide_input=True)
+    def clear_password(self) -> None:
+        """Forget the cached password so the next lookup resolves it again."""
+        self._password = None
 
 
 # Global config manager instance
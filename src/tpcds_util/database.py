@@ -1,31 +1,347 @@
 """Database connection and operations for Oracle."""
 
+import atexit
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-
-import oracledb
-
-# Force thin mode by clearing Oracle environment variables
-for var in ["ORACLE_HOME", "TNS_ADMIN", "ORACLE_BASE"]:
-    if var in os.environ:
-        del os.environ[var]
+from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import click
-from rich.console import Console
+import oracledb  # Thin mode: oracledb.init_oracle_client() is never called
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .config import config_manager
+from .config import TPCDSConfig, config_manager
+from .ui import console
+
+# Number of executed statements between progress display updates
+PROGRESS_BATCH_SIZE = 50
+
+# Statements cached per pooled session, so repeated dictionary lookups and
+# COUNT(*) queries skip the parse on later executions
+STATEMENT_CACHE_SIZE = 50
+
+# Fetch size for dictionary queries; prefetching one extra row lets the
+# driver detect the end of the result without another round-trip
+METADATA_ARRAYSIZE = 500
+
+# Seconds a get_table_info() result is reused for the same schema
+TABLE_INFO_TTL = 30.0
+
+# Tokens the SQL splitter acts on: line comments, string literals (closed or
+# running past the end of the line), the keywords that start a PL/SQL block
+# and statement terminators. Keywords match as whole words so that
+# identifiers such as d_begin_date do not switch the splitter into block mode.
+_SQL_TOKEN_RE = re.compile(
+    r"(?P<comment>--)"
+    r"|(?P<string>'(?:''|[^'])*'(?!'))"
+    r"|(?P<open_string>'(?:''|[^'])*$)"
+    r"|(?P<plsql>\b(?:BEGIN|DECLARE)\b)"
+    r"|(?P<end>;)",
+    re.IGNORECASE,
+)
+
+# Rest of a string literal that was opened on an earlier line
+_SQL_STRING_TAIL_RE = re.compile(r"(?:''|[^'])*'(?!')")
+
+# System privileges granted to a newly created TPC-DS schema user
+SCHEMA_USER_PRIVILEGES = (
+    "CREATE SESSION",
+    "CREATE TABLE",
+    "CREATE SEQUENCE",
+    "CREATE VIEW",
+    "CREATE PROCEDURE",
+    "CREATE TRIGGER",
+    "CREATE SYNONYM",
+    "UNLIMITED TABLESPACE",
+)
+
+# Literal-only INSERT ... VALUES statements that can be sent with executemany
+_INSERT_VALUES_RE = re.compile(
+    r"^(INSERT\s+INTO\s+[\w$#.\"]+(?:\s*\([^)]*\))?\s+VALUES)\s*\((.*)\)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_LITERAL_RE = re.compile(
+    r"\s*(?:'((?:[^']|'')*)'|([-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|(NULL))\s*(,|$)",
+    re.IGNORECASE,
+)
+
+# Default schema files looked up relative to the working directory, in order
+SCHEMA_FILE_CANDIDATES = (
+    Path("oracle_tpcds_schema.sql"),
+    Path("tpcds.sql"),
+    Path("scripts/side_files/tpcds.sql"),
+)
+
+# TPC-DS data tables, in alphabetical order
+TPCDS_DATA_TABLES = (
+    "CALL_CENTER",
+    "CATALOG_PAGE",
+    "CATALOG_RETURNS",
+    "CATALOG_SALES",
+    "CUSTOMER",
+    "CUSTOMER_ADDRESS",
+    "CUSTOMER_DEMOGRAPHICS",
+    "DATE_DIM",
+    "HOUSEHOLD_DEMOGRAPHICS",
+    "INCOME_BAND",
+    "INVENTORY",
+    "ITEM",
+    "PROMOTION",
+    "REASON",
+    "SHIP_MODE",
+    "STORE",
+    "STORE_RETURNS",
+    "STORE_SALES",
+    "TIME_DIM",
+    "WAREHOUSE",
+    "WEB_PAGE",
+    "WEB_RETURNS",
+    "WEB_SALES",
+    "WEB_SITE",
+)
+
+# All tables created by the TPC-DS schema script
+TPCDS_TABLES = TPCDS_DATA_TABLES + ("DBGEN_VERSION",)
+
+# Drop order: fact tables first, then dimension tables
+TPCDS_DROP_ORDER = (
+    "STORE_RETURNS",
+    "CATALOG_RETURNS",
+    "WEB_RETURNS",
+    "STORE_SALES",
+    "CATALOG_SALES",
+    "WEB_SALES",
+    "INVENTORY",
+    "CUSTOMER",
+    "CUSTOMER_ADDRESS",
+    "CUSTOMER_DEMOGRAPHICS",
+    "HOUSEHOLD_DEMOGRAPHICS",
+    "INCOME_BAND",
+    "ITEM",
+    "PROMOTION",
+    "REASON",
+    "SHIP_MODE",
+    "STORE",
+    "WAREHOUSE",
+    "WEB_PAGE",
+    "WEB_SITE",
+    "CATALOG_PAGE",
+    "CALL_CENTER",
+    "DATE_DIM",
+    "TIME_DIM",
+    "DBGEN_VERSION",
+)
+
+_TPCDS_DATA_TABLES_IN_LIST = ", ".join(f"'{table}'" for table in TPCDS_DATA_TABLES)
+
+# Everything the schema script needs rewritten for a target schema, matched in
+# one pass: CREATE/DROP TABLE of any TPC-DS table, and user_tables in the
+# cleanup block together with a WHERE that may follow it
+_QUALIFY_SQL_RE = re.compile(
+    rf"\b(?P<verb>create|drop)\s+table\s+(?P<table>{'|'.join(TPCDS_TABLES)})\b"
+    r"|\buser_tables\b(?P<where>\s+WHERE\b)?",
+    re.IGNORECASE,
+)
+
+_TABLE_STATS_QUERY = f"""
+SELECT table_name, blocks, avg_row_len
+FROM user_tables
+WHERE table_name IN ({_TPCDS_DATA_TABLES_IN_LIST})
+ORDER BY table_name
+"""
+
+_TABLE_STATS_IN_SCHEMA_QUERY = f"""
+SELECT table_name, blocks, avg_row_len
+FROM all_tables
+WHERE owner = :schema_name
+AND table_name IN ({_TPCDS_DATA_TABLES_IN_LIST})
+ORDER BY table_name
+"""
+
+# Session settings that avoid optimizer plan regressions on Oracle dictionary
+# views (see `config set --metadata-optimizer-hints`)
+_METADATA_SESSION_HINTS = (
+    'ALTER SESSION SET "_optimizer_push_pred_cost_based" = FALSE',
+    'ALTER SESSION SET "_optimizer_squ_bottomup" = FALSE',
+    "ALTER SESSION SET \"_optimizer_cost_based_transformation\" = 'OFF'",
+    "ALTER SESSION SET OPTIMIZER_FEATURES_ENABLE = '10.2.0.5'",
+)
+
+# Drops each listed table, ignoring ORA-00942 and reporting other failures as
+# "table|error" lines so the caller can keep per-table diagnostics. PURGE keeps
+# dropped tables out of the recycle bin, so a recreate starts clean.
+_DROP_TABLES_PLSQL = """
+DECLARE
+    TYPE name_list IS TABLE OF VARCHAR2(261);
+    l_tables name_list := name_list({table_list});
+    l_retry name_list := name_list();
+    l_dropped PLS_INTEGER := 0;
+    l_failed VARCHAR2(32767);
+BEGIN
+    FOR i IN 1 .. l_tables.COUNT LOOP
+        BEGIN
+            EXECUTE IMMEDIATE 'DROP TABLE ' || l_tables(i) || ' CASCADE CONSTRAINTS PURGE';
+            l_dropped := l_dropped + 1;
+        EXCEPTION
+            WHEN OTHERS THEN
+                IF SQLCODE != -942 THEN
+                    l_retry.EXTEND;
+                    l_retry(l_retry.COUNT) := l_tables(i);
+                END IF;
+        END;
+    END LOOP;
+    -- Second pass for drops blocked by ordering or transient locks
+    FOR i IN 1 .. l_retry.COUNT LOOP
+        BEGIN
+            EXECUTE IMMEDIATE 'DROP TABLE ' || l_retry(i) || ' CASCADE CONSTRAINTS PURGE';
+            l_dropped := l_dropped + 1;
+        EXCEPTION
+            WHEN OTHERS THEN
+                IF SQLCODE != -942 THEN
+                    l_failed := l_failed || l_retry(i) || '|' || SQLERRM || CHR(10);
+                END IF;
+        END;
+    END LOOP;
+    :dropped := l_dropped;
+    :failed := l_failed;
+END;
+"""
+
+
+# Runs a group of DDL statements in one round-trip. Each statement executes in
+# its own exception scope, so one failure doesn't stop the rest; failures come
+# back as "offset|error" lines.
+_DDL_BLOCK_PLSQL = """
+DECLARE
+    l_failed VARCHAR2(32767);
+    PROCEDURE run(p_offset PLS_INTEGER, p_sql VARCHAR2) IS
+    BEGIN
+        EXECUTE IMMEDIATE p_sql;
+    EXCEPTION
+        WHEN OTHERS THEN
+            l_failed := l_failed || p_offset || '|' || SQLERRM || CHR(10);
+    END;
+BEGIN
+{calls}
+    :failed := l_failed;
+END;
+"""
+
+# Maximum number of DDL statements sent in one block
+DDL_BATCH_SIZE = 50
+
+# Longest statement embedded in a DDL block; keeps the literal well inside the
+# 32K PL/SQL limit even for multi-byte text
+_DDL_LITERAL_MAX_LEN = 8000
+
+_DDL_STATEMENT_RE = re.compile(
+    r"(?:CREATE|ALTER|DROP|COMMENT|GRANT|REVOKE|TRUNCATE|RENAME)\s", re.IGNORECASE
+)
+_PLSQL_KEYWORD_RE = re.compile(r"\b(?:BEGIN|DECLARE)\b", re.IGNORECASE)
+_Q_QUOTE_DELIMITERS = (("[", "]"), ("{", "}"), ("<", ">"), ("(", ")"), ("!", "!"))
+
+
+def _ddl_literal(stmt: str) -> Optional[str]:
+    """Quote a plain DDL statement for EXECUTE IMMEDIATE inside a DDL block.
+
+    Returns None for anything that has to be executed on its own: non-DDL,
+    PL/SQL, overly long statements, or text no q-quote delimiter can enclose.
+    """
+    if (
+        len(stmt) > _DDL_LITERAL_MAX_LEN
+        or not _DDL_STATEMENT_RE.match(stmt)
+        or _PLSQL_KEYWORD_RE.search(stmt)
+    ):
+        return None
+    for opening, closing in _Q_QUOTE_DELIMITERS:
+        if f"{closing}'" not in stmt:
+            return f"q'{opening}{stmt}{closing}'"
+    return None
+
+
+def _parse_insert_values(stmt: str) -> Optional[Tuple[str, List[Any]]]:
+    """Split a literal-only INSERT ... VALUES statement into bind SQL and values.
+
+    Returns None for anything else (DDL, INSERT ... SELECT, expressions in the
+    VALUES list), which has to be executed as written.
+    """
+    match = _INSERT_VALUES_RE.match(stmt)
+    if not match:
+        return None
+
+    prefix, values_sql = match.groups()
+    values: List[Any] = []
+    pos = 0
+    separator = ","
+    while separator:
+        literal = _LITERAL_RE.match(values_sql, pos)
+        if not literal or literal.end() == pos:
+            return None
+        text, number, _, separator = literal.groups()
+        if text is not None:
+            values.append(text.replace("''", "'"))
+        elif number is not None:
+            values.append(Decimal(number))
+        else:
+            values.append(None)
+        pos = literal.end()
+
+    binds = ", ".join(f":{n}" for n in range(1, len(values) + 1))
+    return f"{' '.join(prefix.split())} ({binds})", values
+
+
+@lru_cache(maxsize=8)
+def _parse_sql_file(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Parse a SQL file into statements, memoized per file version.
 
-console = Console()
+    ``mtime_ns`` and ``size`` only serve as cache key, so an edited file is
+    parsed again while repeated runs against the same file skip the parse.
+    """
+    # Split while reading so the whole file is never held in memory; the
+    # splitter already drops comments and empty statements
+    with open(path, "r", encoding="utf-8") as f:
+        return tuple(DatabaseManager._split_sql_statements(f))
+
+
+@lru_cache(maxsize=1)
+def _find_schema_file() -> Optional[Path]:
+    """Return the first default schema file that exists, probed once per process."""
+    for candidate in SCHEMA_FILE_CANDIDATES:
+        if candidate.exists():
+            return candidate
+    return None
 
 
 class DatabaseManager:
     """Manages Oracle database connections and operations."""
 
     def __init__(self):
-        self.config = config_manager.load()
+        self._pool: Optional[oracledb.ConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._atexit_registered = False
+        self._table_info_cache: Dict[
+            Optional[str], Tuple[float, List[Dict[str, Any]]]
+        ] = {}
+
+    @property
+    def config(self) -> TPCDSConfig:
+        """Current configuration (parsed once and memoized by the config manager)."""
+        return config_manager.load()
 
     def _get_schema_name(self, schema_override: Optional[str] = None) -> str:
         """Get effective schema name (override > config > current user)."""
@@ -38,32 +354,93 @@ class DatabaseManager:
             return ""
 
     def _qualify_table_name(self, table_name: str, schema_name: str = "") -> str:
-        """Qualify table name with schema if provided."""
+        """Qualify table name with schema if provided.
+
+        Both names are expected in upper case already, as they come from the
+        table constants, the data dictionary and _get_schema_name().
+        """
         if schema_name:
-            return f"{schema_name}.{table_name.upper()}"
+            return f"{schema_name}.{table_name}"
         else:
-            return table_name.upper()
+            return table_name
+
+    def _get_pool(self) -> oracledb.ConnectionPool:
+        """Get the session pool, creating it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                db_config = self.config.database
+                self._pool = oracledb.create_pool(
+                    user=db_config.username,
+                    password=config_manager.get_password(),
+                    dsn=db_config.dsn,
+                    min=1,
+                    max=max(self.config.parallel_workers, 1),
+                    increment=1,
+                    getmode=oracledb.POOL_GETMODE_WAIT,
+                    stmtcachesize=STATEMENT_CACHE_SIZE,
+                )
+                if not self._atexit_registered:
+                    # Pools re-created after close() reuse the same hook
+                    atexit.register(self.close)
+                    self._atexit_registered = True
+            return self._pool
+
+    def close(self) -> None:
+        """Close the session pool; the next connection request creates a new one."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close(force=True)
+                self._pool = None
+
+    def _acquire(self) -> oracledb.Connection:
+        """Acquire a pooled session, discarding the pool if the login is rejected."""
+        try:
+            return self._get_pool().acquire()
+        except oracledb.Error as e:
+            if "ORA-01017" in str(e):
+                # Pools only log in on acquire(), so the rejected password
+                # surfaces here; don't keep reusing the pool or the password
+                self.close()
+                config_manager.clear_password()
+            raise
 
     @contextmanager
-    def get_connection(self) -> Generator[oracledb.Connection, None, None]:
-        """Get database connection context manager."""
-        password = config_manager.get_password()
-
+    def get_connection(
+        self, discard: bool = False
+    ) -> Generator[oracledb.Connection, None, None]:
+        """Get database connection context manager.
+
+        Connections are acquired from a session pool that is created on first
+        use, so repeated operations reuse already authenticated sessions. Pass
+        ``discard=True`` after changing session settings so that the session
+        is dropped from the pool instead of being handed to the next caller.
+        """
         try:
-            connection = oracledb.connect(
-                user=self.config.database.username,
-                password=password,
-                dsn=self.config.database.dsn,
-            )
-            # Enable autocommit to prevent transaction rollback on container termination
-            connection.autocommit = True
-            yield connection
+            connection = self._acquire()
+            try:
+                # Enable autocommit to prevent transaction rollback on container termination
+                connection.autocommit = True
+                yield connection
+            finally:
+                if discard and self._pool is not None:
+                    self._pool.drop(connection)
+                else:
+                    # Closing a pooled connection releases it back to the pool
+                    connection.close()
         except oracledb.Error as e:
             click.echo(f"Database connection error: {e}", err=True)
             raise
-        finally:
-            if "connection" in locals():
-                connection.close()
+
+    def _apply_metadata_hints(self, cursor: oracledb.Cursor) -> None:
+        """Apply optimizer session hints for dictionary queries if enabled."""
+        if not self.config.metadata_optimizer_hints:
+            return
+
+        for hint in _METADATA_SESSION_HINTS:
+            try:
+                cursor.execute(hint)
+            except oracledb.Error:
+                pass  # Not supported on this release; fall back to defaults
 
     def test_connection(self) -> bool:
         """Test database connection."""
@@ -81,171 +458,255 @@ class DatabaseManager:
         if not target_schema:
             return sql_content
 
-        # Define TPC-DS table names that need to be qualified
-        tpcds_tables = [
-            "CALL_CENTER",
-            "CATALOG_PAGE",
-            "CATALOG_RETURNS",
-            "CATALOG_SALES",
-            "CUSTOMER",
-            "CUSTOMER_ADDRESS",
-            "CUSTOMER_DEMOGRAPHICS",
-            "DATE_DIM",
-            "HOUSEHOLD_DEMOGRAPHICS",
-            "INCOME_BAND",
-            "INVENTORY",
-            "ITEM",
-            "PROMOTION",
-            "REASON",
-            "SHIP_MODE",
-            "STORE",
-            "STORE_RETURNS",
-            "STORE_SALES",
-            "TIME_DIM",
-            "WAREHOUSE",
-            "WEB_PAGE",
-            "WEB_RETURNS",
-            "WEB_SALES",
-            "WEB_SITE",
-            "DBGEN_VERSION",
-        ]
-
-        import re
-
-        modified_sql = sql_content
-
-        # Replace CREATE TABLE statements to target the specified schema
-        for table in tpcds_tables:
-            # Pattern for CREATE TABLE statements (case insensitive)
-            pattern = rf"\bcreate\s+table\s+{table}\b"
-            replacement = f"create table {target_schema}.{table}"
-            modified_sql = re.sub(
-                pattern, replacement, modified_sql, flags=re.IGNORECASE
-            )
+        owner_filter = f"all_tables WHERE owner = '{target_schema.upper()}'"
 
-            # Also handle DROP TABLE statements in the cleanup section
-            pattern = rf"\bdrop\s+table\s+{table}\b"
-            replacement = f"drop table {target_schema}.{table}"
-            modified_sql = re.sub(
-                pattern, replacement, modified_sql, flags=re.IGNORECASE
-            )
+        def rewrite(match: "re.Match[str]") -> str:
+            if match.group("verb"):
+                # Point CREATE TABLE and the cleanup DROP TABLE statements at
+                # the target schema
+                verb = match.group("verb").lower()
+                return f"{verb} table {target_schema}.{match.group('table').upper()}"
+            # The dynamic cleanup section reads all_tables for the target
+            # owner, continuing an existing WHERE with AND
+            return owner_filter + (" AND" if match.group("where") else "")
 
-        # Handle the dynamic cleanup section that queries user_tables
-        # Replace user_tables with all_tables and add owner condition
-        if "user_tables" in modified_sql:
-            modified_sql = modified_sql.replace(
-                "user_tables", f"all_tables WHERE owner = '{target_schema.upper()}'"
-            )
-            # Fix the WHERE clause to avoid double WHERE
-            modified_sql = re.sub(
-                r"all_tables WHERE owner = '[^']+' WHERE",
-                f"all_tables WHERE owner = '{target_schema.upper()}' AND",
-                modified_sql,
+        return _QUALIFY_SQL_RE.sub(rewrite, sql_content)
+
+    @staticmethod
+    def _split_sql_statements(lines: Iterable[str]) -> List[str]:
+        """Split SQL script lines into individual statements.
+
+        Regular statements end with ``;``. Oracle PL/SQL blocks (anything
+        containing the BEGIN or DECLARE keyword) keep their inner semicolons and
+        end with a ``/`` on its own line. Comments are dropped, and semicolons
+        or ``--`` inside string literals are left alone.
+        """
+        statements = []
+        segments: List[str] = []
+        in_plsql = False
+        in_string = False
+
+        def flush() -> None:
+            statement = "\n".join(
+                segment.strip() for segment in segments if segment.strip()
             )
+            if statement:
+                statements.append(statement)
+            segments.clear()
+
+        for line in lines:
+            pos = 0
+            if in_string:
+                tail = _SQL_STRING_TAIL_RE.match(line)
+                if not tail:
+                    segments.append(line)
+                    continue
+                pos = tail.end()
+                in_string = False
+            elif line.strip() == "/":
+                # End of PL/SQL block
+                flush()
+                in_plsql = False
+                continue
+
+            start, end = 0, len(line)
+            for token in _SQL_TOKEN_RE.finditer(line, pos):
+                kind = token.lastgroup
+                if kind == "comment":
+                    end = token.start()
+                    break
+                if kind == "open_string":
+                    in_string = True
+                elif kind == "plsql":
+                    in_plsql = True
+                elif kind == "end" and not in_plsql:
+                    segments.append(line[start : token.start()])
+                    flush()
+                    start = token.end()
+            segments.append(line[start:end])
+
+        # Add any remaining statement
+        flush()
+        return statements
+
+    def _batch_statements(
+        self, statements: List[str]
+    ) -> Iterator[Tuple[int, List[str], Optional[str], List[List[Any]]]]:
+        """Group consecutive same-shaped INSERTs and consecutive plain DDL.
+
+        Yields (index of first statement, statements, bind SQL, rows). Bind SQL
+        is set for a run of INSERT ... VALUES statements to send with
+        executemany. Otherwise it is None, and a group of several statements is
+        a run of DDL for _execute_ddl_block().
+        """
+        start = 0
+        while start < len(statements):
+            parsed = _parse_insert_values(statements[start])
+            end = start + 1
+            rows = []
+            if parsed:
+                bind_sql, values = parsed
+                rows.append(values)
+                while end < len(statements):
+                    next_parsed = _parse_insert_values(statements[end])
+                    if not next_parsed or next_parsed[0] != bind_sql:
+                        break
+                    rows.append(next_parsed[1])
+                    end += 1
+            elif _ddl_literal(statements[start]):
+                while (
+                    end < len(statements)
+                    and end - start < DDL_BATCH_SIZE
+                    and _ddl_literal(statements[end])
+                ):
+                    end += 1
 
-        return modified_sql
+            if len(rows) > 1:
+                yield start, statements[start:end], bind_sql, rows
+            else:
+                yield start, statements[start:end], None, []
+            start = end
+
+    def _execute_ddl_block(
+        self, cursor: oracledb.Cursor, statements: List[str]
+    ) -> List[Tuple[int, str]]:
+        """Execute plain DDL statements in a single PL/SQL block.
+
+        Returns (offset, error) pairs for the statements that failed.
+        """
+        calls = "\n".join(
+            f"    run({offset}, {_ddl_literal(stmt)});"
+            for offset, stmt in enumerate(statements)
+        )
+        failed = cursor.var(str, 32767)
+
+        cursor.execute(_DDL_BLOCK_PLSQL.format(calls=calls), {"failed": failed})
+
+        failures = []
+        for entry in (failed.getvalue() or "").splitlines():
+            offset, _, error = entry.partition("|")
+            failures.append((int(offset), error))
+        return failures
+
+    def _execute_each(
+        self, cursor: oracledb.Cursor, statements: List[str]
+    ) -> List[Tuple[int, oracledb.Error]]:
+        """Execute statements one by one after a batched call failed as a whole.
+
+        Returns (offset, error) pairs for the statements that failed.
+        """
+        failures = []
+        for offset, stmt in enumerate(statements):
+            try:
+                cursor.execute(stmt)
+            except oracledb.Error as e:
+                failures.append((offset, e))
+        return failures
 
     def execute_sql_file(
         self, sql_file: Path, target_schema: Optional[str] = None
     ) -> bool:
         """Execute SQL statements from a file, optionally targeting a specific schema."""
+        self.clear_table_info_cache()
         if not sql_file.exists():
             click.echo(f"SQL file not found: {sql_file}", err=True)
             return False
 
+        debug = bool(os.getenv("TPCDS_DEBUG"))
+
         try:
-            with open(sql_file, "r") as f:
-                sql_content = f.read()
+            stat = sql_file.stat()
+            statements = list(
+                _parse_sql_file(str(sql_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            )
 
             # Modify SQL for target schema if specified
             if target_schema:
-                sql_content = self._qualify_sql_for_schema(sql_content, target_schema)
+                statements = [
+                    self._qualify_sql_for_schema(stmt, target_schema)
+                    for stmt in statements
+                ]
                 console.print(
                     f"📝 Modified SQL statements for target schema: {target_schema}",
                     style="cyan",
                 )
 
-            # Handle Oracle PL/SQL blocks which end with /
-            # Split by / when it's on its own line, otherwise split by ;
-            statements = []
-            current_stmt = ""
-            lines = sql_content.split("\n")
-
-            for line in lines:
-                stripped_line = line.strip()
-
-                # Skip comment lines
-                if stripped_line.startswith("--") or not stripped_line:
-                    continue
-
-                if stripped_line == "/":
-                    # End of PL/SQL block
-                    if current_stmt.strip():
-                        statements.append(current_stmt.strip())
-                        current_stmt = ""
-                elif stripped_line.endswith(";") and not any(
-                    keyword in current_stmt.upper() for keyword in ["BEGIN", "DECLARE"]
-                ):
-                    # Regular SQL statement - remove the semicolon and add to statements
-                    current_stmt += stripped_line[:-1]  # Remove semicolon
-                    if current_stmt.strip():
-                        statements.append(current_stmt.strip())
-                    current_stmt = ""
-                else:
-                    # Continue building statement
-                    if current_stmt:
-                        current_stmt += "\n" + stripped_line
-                    else:
-                        current_stmt = stripped_line
-
-            # Add any remaining statement
-            if current_stmt.strip():
-                statements.append(current_stmt.strip())
-
-            # Filter out empty statements and comments
-            statements = [
-                stmt
-                for stmt in statements
-                if stmt.strip() and not stmt.strip().startswith("--")
-            ]
-
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
                     with Progress(
                         SpinnerColumn(),
                         TextColumn("[progress.description]{task.description}"),
                         console=console,
+                        # Repaints are wasted when output is not a terminal
+                        disable=not console.is_terminal,
                     ) as progress:
                         task = progress.add_task(
                             f"Executing {sql_file.name}...", total=len(statements)
                         )
 
-                        for i, stmt in enumerate(statements):
-                            if stmt.strip():
-                                try:
-                                    # Debug: print first few statements
-                                    if i < 3:
-                                        console.print(
-                                            f"Executing statement {i + 1}: {stmt[:100]}...",
-                                            style="cyan",
+                        errors = []
+                        pending = 0
+                        for start, batch, bind_sql, rows in self._batch_statements(
+                            statements
+                        ):
+                            i = start + 1
+                            if debug:
+                                console.print(
+                                    f"Executing statement {i}: {batch[0][:100]}...",
+                                    style="cyan",
+                                )
+                            try:
+                                if bind_sql is not None:
+                                    # One round-trip for the whole run of INSERTs
+                                    cursor.executemany(bind_sql, rows, batcherrors=True)
+                                    for error in cursor.getbatcherrors():
+                                        errors.append(
+                                            (
+                                                i + error.offset,
+                                                batch[error.offset],
+                                                error.message,
+                                            )
                                         )
-                                    cursor.execute(stmt)
-                                    progress.advance(task)
-                                except oracledb.Error as e:
-                                    # Log the error but continue with next statement
-                                    console.print(
-                                        f"Error in statement {i + 1}: {str(e)[:150]}",
-                                        style="red",
-                                    )
-                                    if i < 3:
-                                        console.print(
-                                            f"Failed statement: {stmt[:200]}",
-                                            style="red",
+                                elif len(batch) > 1:
+                                    # One round-trip for the whole run of DDL
+                                    for offset, message in self._execute_ddl_block(
+                                        cursor, batch
+                                    ):
+                                        errors.append(
+                                            (i + offset, batch[offset], message)
                                         )
-                                    progress.advance(task)
+                                else:
+                                    cursor.execute(batch[0])
+                            except oracledb.Error as e:
+                                if len(batch) == 1:
+                                    # Record the error but continue with next statement
+                                    errors.append((i, batch[0], e))
+                                else:
+                                    # The batched call failed as a whole (a bind type
+                                    # mismatch in an INSERT run, or the DDL block not
+                                    # compiling), so run its statements one by one
+                                    for offset, error in self._execute_each(
+                                        cursor, batch
+                                    ):
+                                        errors.append(
+                                            (i + offset, batch[offset], error)
+                                        )
+
+                            # Advance the progress display in batches rather
+                            # than redrawing it for every statement
+                            pending += len(batch)
+                            if pending >= PROGRESS_BATCH_SIZE:
+                                progress.advance(task, pending)
+                                pending = 0
+                        progress.advance(task, pending)
 
                         conn.commit()
 
+            for i, stmt, e in errors:
+                console.print(f"Error in statement {i}: {str(e)[:150]}", style="red")
+                if debug:
+                    console.print(f"Failed statement: {stmt[:200]}", style="red")
+
             console.print(f"✅ Successfully executed {sql_file.name}", style="green")
             return True
 
@@ -309,28 +770,18 @@ class DatabaseManager:
                             f"⚠️  User {schema_name} already exists", style="yellow"
                         )
 
-                    # Grant basic privileges
-                    privileges = [
-                        "CREATE SESSION",
-                        "CREATE TABLE",
-                        "CREATE SEQUENCE",
-                        "CREATE VIEW",
-                        "CREATE PROCEDURE",
-                        "CREATE TRIGGER",
-                        "CREATE SYNONYM",
-                    ]
-
-                    for privilege in privileges:
-                        try:
-                            cursor.execute(f"GRANT {privilege} TO {schema_name}")
-                        except oracledb.Error:
-                            pass  # May already be granted
-
-                    # Grant unlimited tablespace quota
+                    # Grant basic privileges and unlimited tablespace quota in
+                    # one statement; if that fails, grant what we can one by one
                     try:
-                        cursor.execute(f"GRANT UNLIMITED TABLESPACE TO {schema_name}")
+                        cursor.execute(
+                            f"GRANT {', '.join(SCHEMA_USER_PRIVILEGES)} TO {schema_name}"
+                        )
                     except oracledb.Error:
-                        pass  # May already be granted
+                        for privilege in SCHEMA_USER_PRIVILEGES:
+                            try:
+                                cursor.execute(f"GRANT {privilege} TO {schema_name}")
+                            except oracledb.Error:
+                                pass  # May already be granted
 
                     console.print(
                         f"✅ Privileges granted to user {schema_name}", style="green"
@@ -367,17 +818,11 @@ class DatabaseManager:
                         f'CREATE USER {schema_name} IDENTIFIED BY "{user_password}"'
                     )
 
-                    # Grant basic privileges
-                    privileges = [
-                        "CREATE SESSION",
-                        "CREATE TABLE",
-                        "UNLIMITED TABLESPACE",
-                    ]
-
-                    for privilege in privileges:
-                        cursor.execute(f"GRANT {privilege} TO {schema_name}")
-
-                    conn.commit()
+                    # Grant basic privileges (DDL commits implicitly)
+                    cursor.execute(
+                        "GRANT CREATE SESSION, CREATE TABLE, UNLIMITED TABLESPACE "
+                        f"TO {schema_name}"
+                    )
 
                     console.print(
                         f"✅ Created database user {schema_name}", style="green"
@@ -415,14 +860,19 @@ class DatabaseManager:
 
     def _check_create_privileges(self, target_schema: str) -> bool:
         """Check if current user can create tables in target schema."""
+        # The probe is only about cross-schema rights; the connected user
+        # targeting its own schema needs no round-trips
+        if target_schema.upper() == self.config.database.username.upper():
+            return True
+
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # Test if we can create a table in the target schema
+                    # Test if we can create a table in the target schema (DDL
+                    # commits implicitly)
                     test_table = f"{target_schema}.TPCDS_PRIVILEGE_TEST"
                     cursor.execute(f"CREATE TABLE {test_table} (test_col NUMBER)")
                     cursor.execute(f"DROP TABLE {test_table}")
-                    conn.commit()
                     return True
         except oracledb.Error:
             return False
@@ -436,18 +886,7 @@ class DatabaseManager:
         schema_name = self._get_schema_name(schema_override)
 
         if schema_file is None:
-            # Look for oracle_tpcds_schema.sql in current directory
-            candidates = [
-                Path("oracle_tpcds_schema.sql"),
-                Path("tpcds.sql"),
-                Path("scripts/side_files/tpcds.sql"),
-            ]
-
-            for candidate in candidates:
-                if candidate.exists():
-                    schema_file = candidate
-                    break
-
+            schema_file = _find_schema_file()
             if schema_file is None:
                 click.echo(
                     "Schema file (oracle_tpcds_schema.sql or tpcds.sql) not found. Please specify path with --schema-file",
@@ -459,8 +898,17 @@ class DatabaseManager:
         if schema_name:
             console.print(f"🎯 Target schema: {schema_name}", style="cyan")
 
-            # Check if target schema user exists
-            if not self._check_schema_user_exists(schema_name):
+            # The user check and the privilege probe use separate pooled
+            # sessions, so run them side by side; the probe only has to be
+            # repeated if the user turns out to be missing
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                user_exists = executor.submit(
+                    self._check_schema_user_exists, schema_name
+                )
+                can_create = executor.submit(self._check_create_privileges, schema_name)
+            can_create_tables = can_create.result()
+
+            if not user_exists.result():
                 console.print(
                     f"📋 Schema user {schema_name} does not exist, creating...",
                     style="yellow",
@@ -473,9 +921,10 @@ class DatabaseManager:
                         f"💡 Proceeding to check if current user has privileges to create tables in {schema_name}",
                         style="blue",
                     )
+                can_create_tables = self._check_create_privileges(schema_name)
 
             # Check if we have privileges to create tables in target schema
-            if not self._check_create_privileges(schema_name):
+            if not can_create_tables:
                 console.print(
                     f"❌ Current user cannot create tables in schema {schema_name}",
                     style="red",
@@ -505,10 +954,36 @@ class DatabaseManager:
 
         return self.execute_sql_file(schema_file, target_schema=schema_name)
 
+    def _drop_tables(
+        self, cursor: oracledb.Cursor, qualified_names: List[str]
+    ) -> Tuple[int, List[Tuple[str, str]]]:
+        """Drop tables in a single PL/SQL block.
+
+        Drops that fail on the first pass (e.g. ORA-02449 or ORA-00054) are
+        retried once after the others have gone. Returns the number of dropped
+        tables and a list of (table, error) pairs for drops that still failed
+        with anything other than ORA-00942.
+        """
+        table_list = ", ".join(f"'{name}'" for name in qualified_names)
+        dropped = cursor.var(int)
+        failed = cursor.var(str, 32767)
+
+        cursor.execute(
+            _DROP_TABLES_PLSQL.format(table_list=table_list),
+            {"dropped": dropped, "failed": failed},
+        )
+
+        failures = []
+        for entry in (failed.getvalue() or "").splitlines():
+            qualified_name, _, error = entry.partition("|")
+            failures.append((qualified_name, error))
+        return dropped.getvalue() or 0, failures
+
     def drop_schema(
         self, confirm: bool = False, schema_override: Optional[str] = None
     ) -> bool:
         """Drop TPC-DS tables (with confirmation). Note: This does not drop the Oracle schema/user itself."""
+        self.clear_table_info_cache()
         schema_name = self._get_schema_name(schema_override)
 
         if not confirm:
@@ -522,47 +997,20 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # First, discover what TPC-DS tables actually exist
-                    if schema_name:
-                        # Query tables in specified schema
-                        cursor.execute(
-                            """
-                            SELECT table_name 
-                            FROM all_tables 
-                            WHERE owner = :schema_name 
-                            AND table_name IN (
-                                'CALL_CENTER', 'CATALOG_PAGE', 'CATALOG_RETURNS', 'CATALOG_SALES',
-                                'CUSTOMER', 'CUSTOMER_ADDRESS', 'CUSTOMER_DEMOGRAPHICS', 'DATE_DIM',
-                                'HOUSEHOLD_DEMOGRAPHICS', 'INCOME_BAND', 'INVENTORY', 'ITEM',
-                                'PROMOTION', 'REASON', 'SHIP_MODE', 'STORE', 'STORE_RETURNS',
-                                'STORE_SALES', 'TIME_DIM', 'WAREHOUSE', 'WEB_PAGE', 'WEB_RETURNS',
-                                'WEB_SALES', 'WEB_SITE', 'DBGEN_VERSION'
-                            )
-                            ORDER BY table_name
-                        """,
-                            {"schema_name": schema_name.upper()},
-                        )
-                    else:
-                        # Query tables in current user schema
-                        cursor.execute(
-                            """
-                            SELECT table_name 
-                            FROM user_tables 
-                            WHERE table_name IN (
-                                'CALL_CENTER', 'CATALOG_PAGE', 'CATALOG_RETURNS', 'CATALOG_SALES',
-                                'CUSTOMER', 'CUSTOMER_ADDRESS', 'CUSTOMER_DEMOGRAPHICS', 'DATE_DIM',
-                                'HOUSEHOLD_DEMOGRAPHICS', 'INCOME_BAND', 'INVENTORY', 'ITEM',
-                                'PROMOTION', 'REASON', 'SHIP_MODE', 'STORE', 'STORE_RETURNS',
-                                'STORE_SALES', 'TIME_DIM', 'WAREHOUSE', 'WEB_PAGE', 'WEB_RETURNS',
-                                'WEB_SALES', 'WEB_SITE', 'DBGEN_VERSION'
-                            )
-                            ORDER BY table_name
-                        """
+                    # Drop everything in one PL/SQL round-trip; tables that
+                    # don't exist are skipped server-side (ORA-00942), so no
+                    # separate discovery query is needed
+                    qualified_names = [
+                        self._qualify_table_name(table, schema_name)
+                        for table in TPCDS_DROP_ORDER
+                    ]
+                    with console.status("Dropping TPC-DS tables..."):
+                        dropped_count, failures = self._drop_tables(
+                            cursor, qualified_names
                         )
+                        conn.commit()
 
-                    existing_tables = [row[0] for row in cursor.fetchall()]
-
-                    if not existing_tables:
+                    if dropped_count == 0 and not failures:
                         schema_msg = f" in schema {schema_name}" if schema_name else ""
                         console.print(
                             f"No TPC-DS tables found to drop{schema_msg}.",
@@ -570,124 +1018,19 @@ class DatabaseManager:
                         )
                         return True
 
-                    console.print(
-                        f"Found {len(existing_tables)} TPC-DS tables to drop",
-                        style="cyan",
-                    )
-
-                    # Now drop the tables in dependency order (reverse of creation order)
-                    # Fact tables first, then dimension tables
-                    drop_order = [
-                        "STORE_RETURNS",
-                        "CATALOG_RETURNS",
-                        "WEB_RETURNS",
-                        "STORE_SALES",
-                        "CATALOG_SALES",
-                        "WEB_SALES",
-                        "INVENTORY",
-                        "CUSTOMER",
-                        "CUSTOMER_ADDRESS",
-                        "CUSTOMER_DEMOGRAPHICS",
-                        "HOUSEHOLD_DEMOGRAPHICS",
-                        "INCOME_BAND",
-                        "ITEM",
-                        "PROMOTION",
-                        "REASON",
-                        "SHIP_MODE",
-                        "STORE",
-                        "WAREHOUSE",
-                        "WEB_PAGE",
-                        "WEB_SITE",
-                        "CATALOG_PAGE",
-                        "CALL_CENTER",
-                        "DATE_DIM",
-                        "TIME_DIM",
-                        "DBGEN_VERSION",
-                    ]
-
-                    # Filter to only tables that actually exist and preserve order
-                    tables_to_drop = [
-                        table for table in drop_order if table in existing_tables
-                    ]
-                    # Add any remaining tables not in the predefined order
-                    tables_to_drop.extend(
-                        [
-                            table
-                            for table in existing_tables
-                            if table not in tables_to_drop
-                        ]
-                    )
-
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        console=console,
-                    ) as progress:
-                        task = progress.add_task(
-                            "Dropping TPC-DS tables...", total=len(tables_to_drop)
-                        )
-
-                        dropped_count = 0
-                        failed_tables = []
-
-                        for table in tables_to_drop:
-                            try:
-                                qualified_name = self._qualify_table_name(
-                                    table, schema_name
-                                )
-
-                                # For cross-schema operations, we need different approaches
-                                cursor.execute("SELECT USER FROM DUAL")
-                                current_user = cursor.fetchone()[0]
-                                if schema_name and schema_name.upper() != current_user:
-                                    # Trying to drop tables in another schema
-                                    # First try direct drop (if we have permission)
-                                    try:
-                                        cursor.execute(
-                                            f"DROP TABLE {qualified_name} CASCADE CONSTRAINTS"
-                                        )
-                                        dropped_count += 1
-                                    except oracledb.Error as e:
-                                        if "ORA-01031" in str(
-                                            e
-                                        ):  # Insufficient privileges
-                                            # Try to connect as the schema owner or use different approach
-                                            console.print(
-                                                f"Warning: Insufficient privileges to drop {qualified_name}",
-                                                style="yellow",
-                                            )
-                                            failed_tables.append(table)
-                                        elif "ORA-00942" in str(
-                                            e
-                                        ):  # Table doesn't exist
-                                            pass  # Already handled by discovery query
-                                        else:
-                                            console.print(
-                                                f"Warning: Failed to drop {qualified_name}: {e}",
-                                                style="yellow",
-                                            )
-                                            failed_tables.append(table)
-                                else:
-                                    # Dropping tables in current user's schema
-                                    cursor.execute(
-                                        f"DROP TABLE {qualified_name} CASCADE CONSTRAINTS"
-                                    )
-                                    dropped_count += 1
-
-                                progress.advance(task)
-
-                            except oracledb.Error as e:
-                                if "ORA-00942" not in str(
-                                    e
-                                ):  # Ignore "table doesn't exist"
-                                    console.print(
-                                        f"Warning: Failed to drop {table}: {e}",
-                                        style="yellow",
-                                    )
-                                    failed_tables.append(table)
-                                progress.advance(task)
-
-                        conn.commit()
+                    failed_tables = []
+                    for qualified_name, error in failures:
+                        if "ORA-01031" in error:  # Insufficient privileges
+                            console.print(
+                                f"Warning: Insufficient privileges to drop {qualified_name}",
+                                style="yellow",
+                            )
+                        else:
+                            console.print(
+                                f"Warning: Failed to drop {qualified_name}: {error}",
+                                style="yellow",
+                            )
+                        failed_tables.append(qualified_name.rsplit(".", 1)[-1])
 
                     # Report results
                     if dropped_count > 0:
@@ -712,109 +1055,82 @@ class DatabaseManager:
             click.echo(f"Error dropping schema: {e}", err=True)
             return False
 
-    def get_table_info(
+    def iter_table_info(
         self, schema_override: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Get information about TPC-DS tables with actual row counts."""
-        schema_name = self._get_schema_name(schema_override)
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield information about existing TPC-DS tables with actual row counts.
 
-        # List of TPC-DS tables to check
-        tpcds_tables = [
-            "CALL_CENTER",
-            "CATALOG_PAGE",
-            "CATALOG_RETURNS",
-            "CATALOG_SALES",
-            "CUSTOMER",
-            "CUSTOMER_ADDRESS",
-            "CUSTOMER_DEMOGRAPHICS",
-            "DATE_DIM",
-            "HOUSEHOLD_DEMOGRAPHICS",
-            "INCOME_BAND",
-            "INVENTORY",
-            "ITEM",
-            "PROMOTION",
-            "REASON",
-            "SHIP_MODE",
-            "STORE",
-            "STORE_RETURNS",
-            "STORE_SALES",
-            "TIME_DIM",
-            "WAREHOUSE",
-            "WEB_PAGE",
-            "WEB_RETURNS",
-            "WEB_SALES",
-            "WEB_SITE",
-        ]
+        Rows are produced in table name order as they are counted, so callers
+        can render them without waiting for the whole result.
+        """
+        schema_name = self._get_schema_name(schema_override)
 
         try:
-            with self.get_connection() as conn:
+            # The hints alter the session, so keep it out of the pool afterwards
+            with self.get_connection(
+                discard=self.config.metadata_optimizer_hints
+            ) as conn:
                 with conn.cursor() as cursor:
-                    results = []
+                    self._apply_metadata_hints(cursor)
 
-                    for table in tpcds_tables:
+                    # Fetch blocks and avg_row_len for every existing table in
+                    # one query (may be 0 if stats not updated)
+                    cursor.arraysize = METADATA_ARRAYSIZE
+                    cursor.prefetchrows = METADATA_ARRAYSIZE + 1
+                    if schema_name:
+                        cursor.execute(
+                            _TABLE_STATS_IN_SCHEMA_QUERY, {"schema_name": schema_name}
+                        )
+                    else:
+                        cursor.execute(_TABLE_STATS_QUERY)
+                    columns = [col[0] for col in cursor.description]
+                    cursor.rowfactory = lambda *row: dict(zip(columns, row))
+                    table_stats = cursor.fetchall()
+
+                    for stats in table_stats:
+                        table = stats["TABLE_NAME"]
                         qualified_table = self._qualify_table_name(table, schema_name)
 
                         try:
                             # Get actual row count using COUNT(*)
                             cursor.execute(f"SELECT COUNT(*) FROM {qualified_table}")
                             actual_rows = cursor.fetchone()[0]
-
-                            # Get basic table info for blocks and avg_row_len (may be 0 if stats not updated)
-                            if schema_name:
-                                cursor.execute(
-                                    """
-                                SELECT blocks, avg_row_len 
-                                FROM all_tables 
-                                WHERE owner = :schema_name AND table_name = :table_name
-                                """,
-                                    {"schema_name": schema_name, "table_name": table},
-                                )
-                            else:
-                                cursor.execute(
-                                    """
-                                SELECT blocks, avg_row_len 
-                                FROM user_tables 
-                                WHERE table_name = :table_name
-                                """,
-                                    {"table_name": table},
-                                )
-
-                            stats_row = cursor.fetchone()
-                            if stats_row:
-                                blocks, avg_row_len = stats_row
-                            else:
-                                blocks, avg_row_len = 0, 0
-
-                            results.append(
-                                {
-                                    "TABLE_NAME": table,
-                                    "NUM_ROWS": actual_rows,
-                                    "BLOCKS": blocks or 0,
-                                    "AVG_ROW_LEN": avg_row_len or 0,
-                                }
-                            )
-
                         except oracledb.Error as e:
                             if "ORA-00942" in str(e):  # Table doesn't exist
                                 continue  # Skip non-existent tables
-                            else:
-                                # Table exists but other error, include with 0 count
-                                results.append(
-                                    {
-                                        "TABLE_NAME": table,
-                                        "NUM_ROWS": 0,
-                                        "BLOCKS": 0,
-                                        "AVG_ROW_LEN": 0,
-                                    }
-                                )
+                            # Table exists but other error, include with 0 count
+                            actual_rows = 0
 
-                    # Sort results by table name
-                    results.sort(key=lambda x: x["TABLE_NAME"])
-                    return results
+                        yield {
+                            "TABLE_NAME": table,
+                            "NUM_ROWS": actual_rows,
+                            "BLOCKS": stats["BLOCKS"] or 0,
+                            "AVG_ROW_LEN": stats["AVG_ROW_LEN"] or 0,
+                        }
 
         except Exception as e:
             click.echo(f"Error getting table info: {e}", err=True)
-            return []
+
+    def get_table_info(
+        self, schema_override: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get information about TPC-DS tables with actual row counts.
+
+        Results are cached per schema for ``TABLE_INFO_TTL`` seconds; operations
+        that change the tables clear the cache.
+        """
+        schema_name = self._get_schema_name(schema_override)
+        cached = self._table_info_cache.get(schema_name)
+        if cached and time.monotonic() - cached[0] < TABLE_INFO_TTL:
+            return list(cached[1])
+
+        tables = list(self.iter_table_info(schema_override))
+        self._table_info_cache[schema_name] = (time.monotonic(), tables)
+        return list(tables)
+
+    def clear_table_info_cache(self) -> None:
+        """Forget cached table information after tables were changed."""
+        self._table_info_cache.clear()
 
     def create_user(
         self, username: str, password: str = None, tablespace: str = "UNLIMITED"
@@ -932,36 +1248,11 @@ class DatabaseManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        self.clear_table_info_cache()
         try:
             # Default to ALL TPC-DS tables if no specific list provided
             if table_list is None:
-                table_list = [
-                    "DBGEN_VERSION",
-                    "CUSTOMER_ADDRESS",
-                    "CUSTOMER_DEMOGRAPHICS",
-                    "DATE_DIM",
-                    "WAREHOUSE",
-                    "SHIP_MODE",
-                    "TIME_DIM",
-                    "REASON",
-                    "INCOME_BAND",
-                    "ITEM",
-                    "STORE",
-                    "CALL_CENTER",
-                    "CUSTOMER",
-                    "WEB_SITE",
-                    "STORE_RETURNS",
-                    "HOUSEHOLD_DEMOGRAPHICS",
-                    "WEB_PAGE",
-                    "PROMOTION",
-                    "CATALOG_PAGE",
-                    "INVENTORY",
-                    "CATALOG_RETURNS",
-                    "WEB_RETURNS",
-                    "WEB_SALES",
-                    "CATALOG_SALES",
-                    "STORE_SALES",
-                ]
+                table_list = list(TPCDS_TABLES)
 
             console.print(
                 f"📋 Copying {len(table_list)} tables from {source_schema} to {target_schema}",
@@ -986,10 +1277,26 @@ class DatabaseManager:
                     successful_copies = 0
                     failed_copies = []
 
+                    # One lookup of the requested source tables instead of an
+                    # existence query per copied table
+                    names = {
+                        f"t{i}": table.upper() for i, table in enumerate(table_list)
+                    }
+                    source_tables = frozenset()
+                    if names:
+                        cursor.arraysize = METADATA_ARRAYSIZE
+                        cursor.execute(
+                            "SELECT table_name FROM all_tables WHERE owner = :owner "
+                            f"AND table_name IN (:{', :'.join(names)})",
+                            {"owner": source_schema.upper(), **names},
+                        )
+                        source_tables = frozenset(row[0] for row in cursor)
+
                     with Progress(
                         SpinnerColumn(),
                         TextColumn("[progress.description]{task.description}"),
                         console=console,
+                        disable=not console.is_terminal,
                     ) as progress:
                         task = progress.add_task(
                             f"Copying tables to {target_schema}...",
@@ -1006,10 +1313,7 @@ class DatabaseManager:
                                 )
 
                                 # Check if source table exists
-                                check_sql = f"SELECT COUNT(*) FROM all_tables WHERE owner = '{source_schema.upper()}' AND table_name = '{table.upper()}'"
-                                cursor.execute(check_sql)
-
-                                if cursor.fetchone()[0] == 0:
+                                if table.upper() not in source_tables:
                                     console.print(
                                         f"⚠️  Source table {source_table} doesn't exist, skipping",
                                         style="yellow",
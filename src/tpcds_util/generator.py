@@ -3,12 +3,8 @@
 from pathlib import Path
 from typing import Optional
 
-import click
-from rich.console import Console
-
 from .config import config_manager
-
-console = Console()
+from .ui import get_console
 
 
 class DataGenerator:
@@ -27,13 +23,15 @@ class DataGenerator:
         """Generate TPC-DS data files using synthetic data generation."""
 
         # Use defaults from config if not specified
-        scale = scale or self.config.default_scale
+        # Scale 0 is the test mode, so only fall back when no scale was given
+        scale = self.config.default_scale if scale is None else scale
         output_dir = output_dir or self.config.default_output_dir
         parallel = parallel or self.config.parallel_workers
 
         # Always use synthetic data generation
         from .synthetic_generator import create_synthetic_data
 
+        console = get_console()
         console.print("🔬 Generating synthetic TPC-DS compliant data...", style="cyan")
         console.print(
             "📋 This data is license-free and safe for enterprise use", style="green"
@@ -70,6 +68,7 @@ class DataGenerator:
             "dbgen_version",
         ]
 
+        console = get_console()
         console.print(
             "TPC-DS Tables Available for Synthetic Generation:", style="bold blue"
         )
@@ -7,13 +7,11 @@ from typing import Dict, List, Optional
 
 import click
 import oracledb
-from rich.console import Console
 from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
 
 from .config import config_manager
 from .database import db_manager
-
-console = Console()
+from .ui import console
 
 
 class DataLoader:
@@ -148,6 +146,45 @@ TRAILING NULLCOLS
             click.echo(f"Error loading {table}: {e}", err=True)
             return False
 
+    def _insert_batch(
+        self,
+        cursor: oracledb.Cursor,
+        insert_sql: str,
+        batch_data: List[List],
+        table: str,
+    ) -> int:
+        """Insert a batch in one round-trip, skipping rows Oracle rejects.
+
+        If the array call fails as a whole (e.g. a bind conversion error),
+        the batch is retried one row at a time so the good rows still land.
+
+        Returns the number of rows inserted.
+        """
+        try:
+            cursor.executemany(insert_sql, batch_data, batcherrors=True)
+        except oracledb.Error as e:
+            console.print(
+                f"Batch insert failed, trying individual inserts: {str(e)[:100]}",
+                style="yellow",
+            )
+            inserted = 0
+            for row_data in batch_data:
+                try:
+                    cursor.execute(insert_sql, row_data)
+                    inserted += 1
+                except oracledb.Error:
+                    pass  # Skip problematic rows
+            return inserted
+
+        errors = cursor.getbatcherrors()
+        if errors:
+            console.print(
+                f"Skipped {len(errors)} rows in {table.upper()}: "
+                f"{str(errors[0].message)[:100]}",
+                style="yellow",
+            )
+        return len(batch_data) - len(errors)
+
     def _load_table_direct(
         self, table: str, data_file: Path, schema_override: Optional[str] = None
     ) -> bool:
@@ -197,6 +234,7 @@ TRAILING NULLCOLS
 
                     # Read and insert data in batches for better performance
                     rows_inserted = 0
+                    rows_processed = 0
                     batch_size = 1000
                     batch_data = []
 
@@ -272,53 +310,29 @@ TRAILING NULLCOLS
 
                                 # Execute batch when it reaches batch_size
                                 if len(batch_data) >= batch_size:
-                                    try:
-                                        cursor.executemany(insert_sql, batch_data)
-                                        rows_inserted += len(batch_data)
-                                        conn.commit()
-
-                                        # Progress update
-                                        if rows_inserted % 5000 == 0:
-                                            console.print(
-                                                f"  Loaded {rows_inserted:,} rows into {table.upper()}",
-                                                style="cyan",
-                                            )
+                                    rows_inserted += self._insert_batch(
+                                        cursor, insert_sql, batch_data, table
+                                    )
+                                    conn.commit()
+                                    rows_processed += len(batch_data)
 
-                                    except oracledb.Error as e:
-                                        # Fallback to individual inserts for this batch
+                                    # Progress update; counted on rows sent, as
+                                    # rejected rows put the inserted count off
+                                    # the batch grid
+                                    if rows_processed % 5000 == 0:
                                         console.print(
-                                            f"Batch insert failed, trying individual inserts: {str(e)[:100]}",
-                                            style="yellow",
+                                            f"  Loaded {rows_inserted:,} rows into {table.upper()}",
+                                            style="cyan",
                                         )
-                                        for row_data in batch_data:
-                                            try:
-                                                cursor.execute(insert_sql, row_data)
-                                                rows_inserted += 1
-                                            except oracledb.Error:
-                                                pass  # Skip problematic rows
-                                        conn.commit()
 
                                     batch_data = []  # Reset batch
 
                         # Insert remaining rows in final batch
                         if batch_data:
-                            try:
-                                cursor.executemany(insert_sql, batch_data)
-                                rows_inserted += len(batch_data)
-                                conn.commit()
-                            except oracledb.Error as e:
-                                # Fallback to individual inserts
-                                console.print(
-                                    f"Final batch insert failed, trying individual inserts: {str(e)[:100]}",
-                                    style="yellow",
-                                )
-                                for row_data in batch_data:
-                                    try:
-                                        cursor.execute(insert_sql, row_data)
-                                        rows_inserted += 1
-                                    except oracledb.Error:
-                                        pass
-                                conn.commit()
+                            rows_inserted += self._insert_batch(
+                                cursor, insert_sql, batch_data, table
+                            )
+                            conn.commit()
 
                     # Final commit
                     conn.commit()
@@ -340,6 +354,7 @@ TRAILING NULLCOLS
         schema_override: Optional[str] = None,
     ) -> bool:
         """Load TPC-DS data into database."""
+        db_manager.clear_table_info_cache()
 
         data_dir = data_dir or self.config.default_output_dir
         parallel = parallel or self.config.parallel_workers
@@ -380,6 +395,7 @@ TRAILING NULLCOLS
             TextColumn("{task.completed}/{task.total}"),
             TimeRemainingColumn(),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
 
             if parallel > 1:
@@ -461,6 +477,7 @@ TRAILING NULLCOLS
         self, confirm: bool = False, schema_override: Optional[str] = None
     ) -> bool:
         """Truncate all TPC-DS tables."""
+        db_manager.clear_table_info_cache()
         schema_name = self._get_schema_name(schema_override)
 
         if not confirm:
@@ -480,6 +497,7 @@ TRAILING NULLCOLS
                         TextColumn("[progress.description]{task.description}"),
                         BarColumn(),
                         console=console,
+                        disable=not console.is_terminal,
                     ) as progress:
                         task = progress.add_task(
                             "Truncating tables...", total=len(tables)
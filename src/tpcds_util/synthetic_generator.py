@@ -15,10 +15,9 @@ try:
 except ImportError:
     HAS_FAKER = False
 
-from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
-console = Console()
+from .ui import console
 
 
 @dataclass
@@ -1812,6 +1811,7 @@ class SyntheticDataGenerator:
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
 
             # Generate and write each table in proper dependency order
@@ -1860,6 +1860,7 @@ class SyntheticDataGenerator:
                 "Generating synthetic data...", total=len(tables_to_generate)
             )
 
+            files_written = 0
             for table_name, generator_func in tables_to_generate:
                 progress.update(task, description=f"Generating {table_name}...")
 
@@ -1868,16 +1869,16 @@ class SyntheticDataGenerator:
                     additional_tables = generator_func()
                     for sub_table_name, sub_data in additional_tables.items():
                         self._write_table_to_file(output_path, sub_table_name, sub_data)
+                        files_written += 1
                 else:
                     data = generator_func()
                     self._write_table_to_file(output_path, table_name, data)
+                    files_written += 1
 
                 progress.advance(task)
 
-            # Count total files generated
-            total_files = len(list(output_path.glob("*.dat")))
             console.print(
-                f"✅ Generated {total_files} synthetic data files", style="green"
+                f"✅ Generated {files_written} synthetic data files", style="green"
             )
 
     def _write_table_to_file(
@@ -0,0 +1,22 @@
+"""Shared terminal output helpers for TPC-DS utility."""
+
+from typing import Any
+
+_console = None
+
+
+def get_console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``console`` lazily so importing this module stays cheap."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
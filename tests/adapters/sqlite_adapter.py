@@ -4,13 +4,251 @@ import re
 import sqlite3
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Upper bound on distinct statements remembered per adapter
+ADAPTED_SQL_CACHE_SIZE = 1024
+
+# Statements that only need function names rewritten
+DML_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+# Closed cursors kept per mock connection for reuse
+CURSOR_POOL_SIZE = 8
+
+# Durability settings traded for speed on throwaway test databases
+TEST_DATABASE_PRAGMAS = (
+    "journal_mode = MEMORY",
+    "synchronous = OFF",
+    "temp_store = MEMORY",
+    "cache_size = -65536",  # 64 MiB
+)
+
+# Quotes and statement terminators, the only characters the splitter tracks
+_STATEMENT_TOKEN_RE = re.compile(r"[';]")
+_PLSQL_START_RE = re.compile(r"(BEGIN|DECLARE)\b", re.IGNORECASE)
+# Table named by a CREATE/ALTER TABLE statement, without any schema qualifier
+_DDL_TABLE_RE = re.compile(
+    r"\s*(?:CREATE|ALTER)\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)",
+    re.IGNORECASE,
+)
+
+
+def _iter_statements(lines: Iterable[str]) -> Iterator[str]:
+    """Yield SQL statements from script lines one at a time.
+
+    Statements end with ``;`` outside a string literal. Whole-line ``--``
+    comments are skipped, as are Oracle PL/SQL blocks (BEGIN or DECLARE up to
+    the ``/`` line), which SQLite cannot run.
+    """
+    buffer: List[str] = []
+    in_string = False
+    in_plsql = False
+
+    for line in lines:
+        if not in_string:
+            stripped = line.strip()
+            if in_plsql:
+                in_plsql = stripped != "/"
+                continue
+            at_statement_start = not any(part.strip() for part in buffer)
+            if at_statement_start and _PLSQL_START_RE.match(stripped):
+                in_plsql = True
+                continue
+            if stripped.startswith("--") or stripped == "/":
+                continue
+
+        start = 0
+        for token in _STATEMENT_TOKEN_RE.finditer(line):
+            if token.group() == "'":
+                in_string = not in_string
+            elif not in_string:
+                buffer.append(line[start : token.start()])
+                statement = "".join(buffer).strip()
+                if statement:
+                    yield statement
+                buffer.clear()
+                start = token.end()
+        buffer.append(line[start:])
+
+    statement = "".join(buffer).strip()
+    if statement:
+        yield statement
+
+
+# Core TPC-DS tables simplified for SQLite, used when the full schema file is
+# missing. Kept as one script so it is parsed in a single executescript call.
+_MINIMAL_TPCDS_DDL = ";\n".join(
+    ["BEGIN"]
+    + [
+        """
+        CREATE TABLE IF NOT EXISTS date_dim (
+            d_date_sk INTEGER PRIMARY KEY,
+            d_date_id VARCHAR(16),
+            d_date TEXT,
+            d_month_seq INTEGER,
+            d_week_seq INTEGER,
+            d_quarter_seq INTEGER,
+            d_year INTEGER,
+            d_dow INTEGER,
+            d_moy INTEGER,
+            d_dom INTEGER,
+            d_qoy INTEGER,
+            d_fy_year INTEGER,
+            d_fy_quarter_seq INTEGER,
+            d_fy_week_seq INTEGER,
+            d_day_name VARCHAR(9),
+            d_quarter_name VARCHAR(6),
+            d_holiday VARCHAR(1),
+            d_weekend VARCHAR(1),
+            d_following_holiday VARCHAR(1),
+            d_first_dom INTEGER,
+            d_last_dom INTEGER,
+            d_same_day_ly INTEGER,
+            d_same_day_lq INTEGER,
+            d_current_day VARCHAR(1),
+            d_current_week VARCHAR(1),
+            d_current_month VARCHAR(1),
+            d_current_quarter VARCHAR(1),
+            d_current_year VARCHAR(1)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS customer (
+            c_customer_sk INTEGER PRIMARY KEY,
+            c_customer_id VARCHAR(16),
+            c_current_cdemo_sk INTEGER,
+            c_current_hdemo_sk INTEGER,
+            c_current_addr_sk INTEGER,
+            c_first_shipto_date_sk INTEGER,
+            c_first_sales_date_sk INTEGER,
+            c_salutation VARCHAR(10),
+            c_first_name VARCHAR(20),
+            c_last_name VARCHAR(30),
+            c_preferred_cust_flag VARCHAR(1),
+            c_birth_day INTEGER,
+            c_birth_month INTEGER,
+            c_birth_year INTEGER,
+            c_birth_country VARCHAR(20),
+            c_login VARCHAR(13),
+            c_email_address VARCHAR(50),
+            c_last_review_date INTEGER
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS item (
+            i_item_sk INTEGER PRIMARY KEY,
+            i_item_id VARCHAR(16),
+            i_rec_start_date TEXT,
+            i_rec_end_date TEXT,
+            i_item_desc VARCHAR(200),
+            i_current_price REAL,
+            i_wholesale_cost REAL,
+            i_brand_id INTEGER,
+            i_brand VARCHAR(50),
+            i_class_id INTEGER,
+            i_class VARCHAR(50),
+            i_category_id INTEGER,
+            i_category VARCHAR(50),
+            i_manufact_id INTEGER,
+            i_manufact VARCHAR(50),
+            i_size VARCHAR(20),
+            i_formulation VARCHAR(20),
+            i_color VARCHAR(20),
+            i_units VARCHAR(10),
+            i_container VARCHAR(10),
+            i_manager_id INTEGER,
+            i_product_name VARCHAR(50)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS store (
+            s_store_sk INTEGER PRIMARY KEY,
+            s_store_id VARCHAR(16),
+            s_rec_start_date TEXT,
+            s_rec_end_date TEXT,
+            s_closed_date_sk INTEGER,
+            s_store_name VARCHAR(50),
+            s_number_employees INTEGER,
+            s_floor_space INTEGER,
+            s_hours VARCHAR(20),
+            s_manager VARCHAR(40),
+            s_market_id INTEGER,
+            s_geography_class VARCHAR(100),
+            s_market_desc VARCHAR(100),
+            s_market_manager VARCHAR(40),
+            s_division_id INTEGER,
+            s_division_name VARCHAR(50),
+            s_company_id INTEGER,
+            s_company_name VARCHAR(50),
+            s_street_number VARCHAR(10),
+            s_street_name VARCHAR(60),
+            s_street_type VARCHAR(15),
+            s_suite_number VARCHAR(10),
+            s_city VARCHAR(60),
+            s_county VARCHAR(30),
+            s_state VARCHAR(2),
+            s_zip VARCHAR(10),
+            s_country VARCHAR(20),
+            s_gmt_offset REAL,
+            s_tax_precentage REAL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS store_sales (
+            ss_sold_date_sk INTEGER,
+            ss_sold_time_sk INTEGER,
+            ss_item_sk INTEGER,
+            ss_customer_sk INTEGER,
+            ss_cdemo_sk INTEGER,
+            ss_hdemo_sk INTEGER,
+            ss_addr_sk INTEGER,
+            ss_store_sk INTEGER,
+            ss_promo_sk INTEGER,
+            ss_ticket_number INTEGER,
+            ss_quantity INTEGER,
+            ss_wholesale_cost REAL,
+            ss_list_price REAL,
+            ss_sales_price REAL,
+            ss_ext_discount_amt REAL,
+            ss_ext_sales_price REAL,
+            ss_ext_wholesale_cost REAL,
+            ss_ext_list_price REAL,
+            ss_ext_tax REAL,
+            ss_coupon_amt REAL,
+            ss_net_paid REAL,
+            ss_net_paid_inc_tax REAL,
+            ss_net_profit REAL,
+            PRIMARY KEY (ss_item_sk, ss_ticket_number)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS warehouse (
+            w_warehouse_sk INTEGER PRIMARY KEY,
+            w_warehouse_id VARCHAR(16),
+            w_warehouse_name VARCHAR(20),
+            w_warehouse_sq_ft INTEGER,
+            w_street_number VARCHAR(10),
+            w_street_name VARCHAR(60),
+            w_street_type VARCHAR(15),
+            w_suite_number VARCHAR(10),
+            w_city VARCHAR(60),
+            w_county VARCHAR(30),
+            w_state VARCHAR(2),
+            w_zip VARCHAR(10),
+            w_country VARCHAR(20),
+            w_gmt_offset REAL
+        )
+        """,
+    ]
+    + ["COMMIT"]
+)
 
 
 class SQLiteOracleAdapter:
     """Adapts Oracle-specific SQL to SQLite for testing."""
 
-    def __init__(self):
+    def __init__(self, schema_name: Optional[str] = None):
+        self.schema_name = schema_name
         self.type_mappings = {
             "VARCHAR2": "VARCHAR",
             "NUMBER": "INTEGER",
@@ -36,42 +274,119 @@ class SQLiteOracleAdapter:
             "TO_NUMBER": "CAST",
         }
 
+        # Compile the rewrite patterns once; the mock cursor adapts every
+        # statement it executes.
+        # All type rewrites in one alternation; each mapping gets a named
+        # group so the match can be mapped back to its SQLite type
+        self._type_replacements: Dict[str, str] = {}
+        type_alternatives = []
+        for index, (oracle_type, sqlite_type) in enumerate(self.type_mappings.items()):
+            group = f"t{index}"
+            self._type_replacements[group] = sqlite_type
+            type_alternatives.append(
+                f"(?P<{group}>{oracle_type})"
+                if "(" in oracle_type  # Regex pattern
+                # Use word boundaries to avoid replacing parts of table names
+                else rf"(?P<{group}>\b{oracle_type}\b)"
+            )
+        self._type_re = re.compile("|".join(type_alternatives), re.IGNORECASE)
+        self._function_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self.function_mappings)) + r")\b",
+            re.IGNORECASE,
+        )
+        self._cleanup_re = re.compile(
+            r"TABLESPACE\s+\w+"
+            r"|STORAGE\s*\([^)]+\)"
+            r"|PCTFREE\s+\d+"
+            r"|PCTUSED\s+\d+"
+            r"|INITRANS\s+\d+"
+            r"|MAXTRANS\s+\d+"
+            r"|ENABLE\s+VALIDATE"
+            r"|USING\s+INDEX",
+            re.IGNORECASE,
+        )
+        self._sequence_re = re.compile(r"DEFAULT\s+\w+\.NEXTVAL", re.IGNORECASE)
+        if schema_name:
+            # Strip the known schema wherever it qualifies a name
+            self._schema_prefix_re = re.compile(
+                r"\b" + re.escape(schema_name) + r"\.", re.IGNORECASE
+            )
+        else:
+            # Strip any owner from the table a DDL clause names, leaving
+            # column references and numeric literals like 3.14 alone
+            self._schema_prefix_re = re.compile(
+                r"\b(TABLE|REFERENCES|INDEX|ON)(\s+)[A-Z_]\w*\.(?=[A-Z_])",
+                re.IGNORECASE,
+            )
+        self._whitespace_re = re.compile(r"\s+")
+
+        # Adapted statements keyed by the original Oracle SQL and schema
+        self._adapted: Dict[Tuple[str, Optional[str]], str] = {}
+
+    def _replace_type(self, match: "re.Match[str]") -> str:
+        """Return the SQLite type for a matched Oracle type."""
+        return self._type_replacements[match.lastgroup]
+
+    def _replace_function(self, match: "re.Match[str]") -> str:
+        """Return the SQLite spelling of a matched Oracle function."""
+        return self.function_mappings[match.group(1).upper()]
+
+    def adapt_dml_sql(self, oracle_sql: str) -> str:
+        """Convert Oracle DML to SQLite-compatible SQL.
+
+        Only function names and the known schema qualifier are rewritten; the
+        DDL rewrites would mangle qualified column references such as
+        ``customer.c_customer_sk``.
+        """
+        sql = self._function_re.sub(self._replace_function, oracle_sql)
+        if self.schema_name:
+            # Production qualifies tables, e.g. SELECT COUNT(*) FROM TPCDS.ITEM
+            sql = self._schema_prefix_re.sub("", sql)
+        return sql
+
+    def adapt_sql(self, oracle_sql: str) -> str:
+        """Convert any Oracle statement, picking the DML or DDL rewrite.
+
+        Results are memoized, as mock cursors send the same statements
+        over and over.
+        """
+        key = (oracle_sql, self.schema_name)
+        cached = self._adapted.get(key)
+        if cached is not None:
+            return cached
+
+        if oracle_sql.lstrip()[:6].upper() in DML_KEYWORDS:
+            sql = self.adapt_dml_sql(oracle_sql)
+        else:
+            sql = self.adapt_schema_sql(oracle_sql)
+
+        if len(self._adapted) >= ADAPTED_SQL_CACHE_SIZE:
+            self._adapted.clear()
+        self._adapted[key] = sql
+        return sql
+
     def adapt_schema_sql(self, oracle_sql: str) -> str:
         """Convert Oracle DDL to SQLite-compatible SQL."""
-        sql = oracle_sql.upper()
+        # Patterns are case-insensitive, so the statement is not upper-cased
+        sql = oracle_sql
 
         # Handle data types
-        for oracle_type, sqlite_type in self.type_mappings.items():
-            if "(" in oracle_type:  # Regex pattern
-                sql = re.sub(oracle_type, sqlite_type, sql)
-            else:
-                # Use word boundaries to avoid replacing parts of table names
-                sql = re.sub(r"\b" + oracle_type + r"\b", sqlite_type, sql)
+        sql = self._type_re.sub(self._replace_type, sql)
 
         # Handle Oracle-specific functions
-        for oracle_func, sqlite_func in self.function_mappings.items():
-            sql = sql.replace(oracle_func, sqlite_func)
+        sql = self._function_re.sub(self._replace_function, sql)
 
         # Remove Oracle-specific constraints and options
-        sql = re.sub(r"TABLESPACE\s+\w+", "", sql)
-        sql = re.sub(r"STORAGE\s*\([^)]+\)", "", sql)
-        sql = re.sub(r"PCTFREE\s+\d+", "", sql)
-        sql = re.sub(r"PCTUSED\s+\d+", "", sql)
-        sql = re.sub(r"INITRANS\s+\d+", "", sql)
-        sql = re.sub(r"MAXTRANS\s+\d+", "", sql)
-        sql = re.sub(r"ENABLE\s+VALIDATE", "", sql)
-        sql = re.sub(r"USING\s+INDEX", "", sql)
+        sql = self._cleanup_re.sub("", sql)
 
         # Handle sequences (SQLite uses AUTOINCREMENT)
-        sql = re.sub(r"DEFAULT\s+\w+\.NEXTVAL", "PRIMARY KEY AUTOINCREMENT", sql)
+        sql = self._sequence_re.sub("PRIMARY KEY AUTOINCREMENT", sql)
 
         # Remove schema prefixes
-        sql = re.sub(r"\w+\.(\w+)", r"\1", sql)
+        sql = self._schema_prefix_re.sub("" if self.schema_name else r"\1\2", sql)
 
         # Clean up extra whitespace
-        sql = re.sub(r"\s+", " ", sql).strip()
-
-        return sql
+        return self._whitespace_re.sub(" ", sql).strip()
 
     def create_test_database(self, in_memory: bool = True) -> sqlite3.Connection:
         """Create SQLite database for testing."""
@@ -88,12 +403,23 @@ class SQLiteOracleAdapter:
         # Set SQLite to be more Oracle-like
         conn.execute("PRAGMA case_sensitive_like = ON")
 
+        # Test databases are throwaway, so skip journaling and fsync
+        for pragma in TEST_DATABASE_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+
         return conn
 
     def load_tpcds_schema(
-        self, conn: sqlite3.Connection, schema_file_path: Optional[str] = None
+        self,
+        conn: sqlite3.Connection,
+        schema_file_path: Optional[str] = None,
+        tables: Optional[Sequence[str]] = None,
     ) -> None:
-        """Load TPC-DS schema into SQLite database."""
+        """Load TPC-DS schema into SQLite database.
+
+        When ``tables`` is given, only the DDL for those tables is run from the
+        schema file; the minimal fallback schema is always created in full.
+        """
         if schema_file_path is None:
             schema_file_path = (
                 Path(__file__).parent.parent.parent / "oracle_tpcds_schema.sql"
@@ -104,211 +430,68 @@ class SQLiteOracleAdapter:
             self._create_minimal_tpcds_schema(conn)
             return
 
+        wanted = {table.lower() for table in tables} if tables is not None else None
+
+        # One transaction for the whole schema instead of one per CREATE,
+        # joining the caller's transaction if one is already open
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
         with open(schema_file_path, "r") as f:
-            oracle_sql = f.read()
-
-        # Split into individual statements
-        statements = [stmt.strip() for stmt in oracle_sql.split(";") if stmt.strip()]
-
-        for statement in statements:
-            try:
-                sqlite_sql = self.adapt_schema_sql(statement)
-                if sqlite_sql and not sqlite_sql.startswith("--"):
-                    conn.execute(sqlite_sql)
-            except sqlite3.Error as e:
-                # Log but continue with other statements
-                print(f"Warning: Could not execute statement: {e}")
-                continue
+            for statement in _iter_statements(f):
+                if wanted is not None:
+                    match = _DDL_TABLE_RE.match(statement)
+                    if not match or match.group(1).lower() not in wanted:
+                        continue
+                try:
+                    sqlite_sql = self.adapt_schema_sql(statement)
+                    if sqlite_sql and not sqlite_sql.startswith("--"):
+                        conn.execute(sqlite_sql)
+                except sqlite3.Error as e:
+                    # Log but continue with other statements
+                    print(f"Warning: Could not execute statement: {e}")
+                    continue
 
         conn.commit()
 
     def _create_minimal_tpcds_schema(self, conn: sqlite3.Connection) -> None:
         """Create minimal TPC-DS schema for testing when full schema is not available."""
-
-        # Core TPC-DS tables simplified for SQLite
-        tables_sql = [
-            """
-            CREATE TABLE IF NOT EXISTS date_dim (
-                d_date_sk INTEGER PRIMARY KEY,
-                d_date_id VARCHAR(16),
-                d_date TEXT,
-                d_month_seq INTEGER,
-                d_week_seq INTEGER,
-                d_quarter_seq INTEGER,
-                d_year INTEGER,
-                d_dow INTEGER,
-                d_moy INTEGER,
-                d_dom INTEGER,
-                d_qoy INTEGER,
-                d_fy_year INTEGER,
-                d_fy_quarter_seq INTEGER,
-                d_fy_week_seq INTEGER,
-                d_day_name VARCHAR(9),
-                d_quarter_name VARCHAR(6),
-                d_holiday VARCHAR(1),
-                d_weekend VARCHAR(1),
-                d_following_holiday VARCHAR(1),
-                d_first_dom INTEGER,
-                d_last_dom INTEGER,
-                d_same_day_ly INTEGER,
-                d_same_day_lq INTEGER,
-                d_current_day VARCHAR(1),
-                d_current_week VARCHAR(1),
-                d_current_month VARCHAR(1),
-                d_current_quarter VARCHAR(1),
-                d_current_year VARCHAR(1)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS customer (
-                c_customer_sk INTEGER PRIMARY KEY,
-                c_customer_id VARCHAR(16),
-                c_current_cdemo_sk INTEGER,
-                c_current_hdemo_sk INTEGER,
-                c_current_addr_sk INTEGER,
-                c_first_shipto_date_sk INTEGER,
-                c_first_sales_date_sk INTEGER,
-                c_salutation VARCHAR(10),
-                c_first_name VARCHAR(20),
-                c_last_name VARCHAR(30),
-                c_preferred_cust_flag VARCHAR(1),
-                c_birth_day INTEGER,
-                c_birth_month INTEGER,
-                c_birth_year INTEGER,
-                c_birth_country VARCHAR(20),
-                c_login VARCHAR(13),
-                c_email_address VARCHAR(50),
-                c_last_review_date INTEGER
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS item (
-                i_item_sk INTEGER PRIMARY KEY,
-                i_item_id VARCHAR(16),
-                i_rec_start_date TEXT,
-                i_rec_end_date TEXT,
-                i_item_desc VARCHAR(200),
-                i_current_price REAL,
-                i_wholesale_cost REAL,
-                i_brand_id INTEGER,
-                i_brand VARCHAR(50),
-                i_class_id INTEGER,
-                i_class VARCHAR(50),
-                i_category_id INTEGER,
-                i_category VARCHAR(50),
-                i_manufact_id INTEGER,
-                i_manufact VARCHAR(50),
-                i_size VARCHAR(20),
-                i_formulation VARCHAR(20),
-                i_color VARCHAR(20),
-                i_units VARCHAR(10),
-                i_container VARCHAR(10),
-                i_manager_id INTEGER,
-                i_product_name VARCHAR(50)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS store (
-                s_store_sk INTEGER PRIMARY KEY,
-                s_store_id VARCHAR(16),
-                s_rec_start_date TEXT,
-                s_rec_end_date TEXT,
-                s_closed_date_sk INTEGER,
-                s_store_name VARCHAR(50),
-                s_number_employees INTEGER,
-                s_floor_space INTEGER,
-                s_hours VARCHAR(20),
-                s_manager VARCHAR(40),
-                s_market_id INTEGER,
-                s_geography_class VARCHAR(100),
-                s_market_desc VARCHAR(100),
-                s_market_manager VARCHAR(40),
-                s_division_id INTEGER,
-                s_division_name VARCHAR(50),
-                s_company_id INTEGER,
-                s_company_name VARCHAR(50),
-                s_street_number VARCHAR(10),
-                s_street_name VARCHAR(60),
-                s_street_type VARCHAR(15),
-                s_suite_number VARCHAR(10),
-                s_city VARCHAR(60),
-                s_county VARCHAR(30),
-                s_state VARCHAR(2),
-                s_zip VARCHAR(10),
-                s_country VARCHAR(20),
-                s_gmt_offset REAL,
-                s_tax_precentage REAL
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS store_sales (
-                ss_sold_date_sk INTEGER,
-                ss_sold_time_sk INTEGER,
-                ss_item_sk INTEGER,
-                ss_customer_sk INTEGER,
-                ss_cdemo_sk INTEGER,
-                ss_hdemo_sk INTEGER,
-                ss_addr_sk INTEGER,
-                ss_store_sk INTEGER,
-                ss_promo_sk INTEGER,
-                ss_ticket_number INTEGER,
-                ss_quantity INTEGER,
-                ss_wholesale_cost REAL,
-                ss_list_price REAL,
-                ss_sales_price REAL,
-                ss_ext_discount_amt REAL,
-                ss_ext_sales_price REAL,
-                ss_ext_wholesale_cost REAL,
-                ss_ext_list_price REAL,
-                ss_ext_tax REAL,
-                ss_coupon_amt REAL,
-                ss_net_paid REAL,
-                ss_net_paid_inc_tax REAL,
-                ss_net_profit REAL,
-                PRIMARY KEY (ss_item_sk, ss_ticket_number)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS warehouse (
-                w_warehouse_sk INTEGER PRIMARY KEY,
-                w_warehouse_id VARCHAR(16),
-                w_warehouse_name VARCHAR(20),
-                w_warehouse_sq_ft INTEGER,
-                w_street_number VARCHAR(10),
-                w_street_name VARCHAR(60),
-                w_street_type VARCHAR(15),
-                w_suite_number VARCHAR(10),
-                w_city VARCHAR(60),
-                w_county VARCHAR(30),
-                w_state VARCHAR(2),
-                w_zip VARCHAR(10),
-                w_country VARCHAR(20),
-                w_gmt_offset REAL
-            )
-            """,
-        ]
-
-        for table_sql in tables_sql:
-            conn.execute(table_sql)
-
-        conn.commit()
+        conn.executescript(_MINIMAL_TPCDS_DDL)
 
     def create_mock_connection(self) -> "MockOracleConnection":
         """Create a mock Oracle connection that uses SQLite backend."""
-        return MockOracleConnection(self.create_test_database())
+        return MockOracleConnection(self.create_test_database(), adapter=self)
+
+
+# Shared by mock connections created without an explicit adapter
+_DEFAULT_ADAPTER = SQLiteOracleAdapter()
 
 
 class MockOracleConnection:
     """Mock Oracle connection that uses SQLite backend for testing."""
 
-    def __init__(self, sqlite_conn: sqlite3.Connection):
+    def __init__(
+        self,
+        sqlite_conn: sqlite3.Connection,
+        adapter: Optional[SQLiteOracleAdapter] = None,
+    ):
         self.sqlite_conn = sqlite_conn
-        self.adapter = SQLiteOracleAdapter()
+        self.adapter = adapter or _DEFAULT_ADAPTER
         self._autocommit = False
+        # Closed cursors waiting to be handed out again by cursor()
+        self._cursor_pool: List["MockOracleCursor"] = []
 
     def cursor(self):
-        """Return a mock Oracle cursor."""
-        return MockOracleCursor(self.sqlite_conn, self.adapter)
+        """Return a mock Oracle cursor, reusing a closed one when available."""
+        if self._cursor_pool:
+            cursor = self._cursor_pool.pop()
+            cursor._reset()
+            return cursor
+        return MockOracleCursor(self.sqlite_conn, self.adapter, self._cursor_pool)
+
+    def begin(self):
+        """Start an explicit transaction spanning several statements."""
+        if not self.sqlite_conn.in_transaction:
+            self.sqlite_conn.execute("BEGIN")
 
     def commit(self):
         """Commit transaction."""
@@ -320,6 +503,8 @@ class MockOracleConnection:
 
     def close(self):
         """Close connection."""
+        while self._cursor_pool:
+            self._cursor_pool.pop().sqlite_cursor.close()
         self.sqlite_conn.close()
 
     def ping(self):
@@ -348,17 +533,28 @@ class MockOracleConnection:
 class MockOracleCursor:
     """Mock Oracle cursor that uses SQLite backend for testing."""
 
-    def __init__(self, sqlite_conn: sqlite3.Connection, adapter: SQLiteOracleAdapter):
+    def __init__(
+        self,
+        sqlite_conn: sqlite3.Connection,
+        adapter: SQLiteOracleAdapter,
+        pool: Optional[List["MockOracleCursor"]] = None,
+    ):
         self.sqlite_conn = sqlite_conn
         self.adapter = adapter
         self.sqlite_cursor = sqlite_conn.cursor()
+        self._pool = pool
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear per-statement state before the cursor is (re)used."""
         self._rowcount = 0
         self._description = None
+        self._closed = False
 
     def execute(self, sql: str, parameters=None):
         """Execute SQL statement."""
         # Adapt Oracle SQL to SQLite
-        sqlite_sql = self.adapter.adapt_schema_sql(sql)
+        sqlite_sql = self.adapter.adapt_sql(sql)
 
         try:
             if parameters:
@@ -375,13 +571,26 @@ class MockOracleCursor:
 
     def executemany(self, sql: str, parameters_list):
         """Execute SQL statement with multiple parameter sets."""
-        sqlite_sql = self.adapter.adapt_schema_sql(sql)
+        sqlite_sql = self.adapter.adapt_sql(sql)
+
+        # In autocommit mode SQLite would commit every row; commit the batch
+        # once instead, like Oracle does after executemany
+        own_transaction = (
+            self.sqlite_conn.isolation_level is None
+            and not self.sqlite_conn.in_transaction
+        )
 
         try:
+            if own_transaction:
+                self.sqlite_conn.execute("BEGIN")
             result = self.sqlite_cursor.executemany(sqlite_sql, parameters_list)
             self._rowcount = self.sqlite_cursor.rowcount
+            if own_transaction:
+                self.sqlite_conn.execute("COMMIT")
             return result
         except sqlite3.Error as e:
+            if own_transaction and self.sqlite_conn.in_transaction:
+                self.sqlite_conn.execute("ROLLBACK")
             raise Exception(f"ORA-00001: {e}")
 
     def fetchone(self):
@@ -399,8 +608,14 @@ class MockOracleCursor:
         return self.sqlite_cursor.fetchmany(size)
 
     def close(self):
-        """Close cursor."""
-        self.sqlite_cursor.close()
+        """Close cursor, returning it to the connection's pool if it has one."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._pool is not None and len(self._pool) < CURSOR_POOL_SIZE:
+            self._pool.append(self)
+        else:
+            self.sqlite_cursor.close()
 
     @property
     def rowcount(self):
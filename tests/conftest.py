@@ -1,12 +1,18 @@
 """Pytest configuration and shared fixtures."""
 
+import copy
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from tpcds_util.config import ConfigManager, DatabaseConfig, TPCDSConfig
+from tpcds_util.config import (
+    ConfigManager,
+    DatabaseConfig,
+    TPCDSConfig,
+    config_manager,
+)
 from tpcds_util.synthetic_generator import DataGenerationConfig
 
 
@@ -17,7 +23,7 @@ def temp_config_dir():
         yield Path(temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_database_config():
     """Create a mock database configuration."""
     return DatabaseConfig(
@@ -30,7 +36,7 @@ def mock_database_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tpcds_config(mock_database_config):
     """Create a mock TPC-DS configuration."""
     return TPCDSConfig(
@@ -47,11 +53,12 @@ def mock_config_manager(mock_tpcds_config, temp_config_dir):
     """Create a mock config manager."""
     config_path = temp_config_dir / "test_config.yaml"
     manager = ConfigManager(config_path=config_path)
-    manager._config = mock_tpcds_config
+    # The config fixture is session-scoped; tests may edit this copy freely
+    manager._config = copy.deepcopy(mock_tpcds_config)
     return manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_data_generation_config():
     """Create a mock data generation configuration."""
     return DataGenerationConfig(
@@ -66,8 +73,8 @@ def mock_data_generation_config():
 @pytest.fixture
 def mock_console():
     """Create a mock console for testing rich output."""
-    with patch("tpcds_util.generator.console") as mock:
-        yield mock
+    with patch("tpcds_util.generator.get_console") as mock:
+        yield mock.return_value
 
 
 @pytest.fixture
@@ -78,16 +85,13 @@ def mock_click_echo():
 
 
 @pytest.fixture(autouse=True)
-def reset_global_config():
+def reset_global_config(monkeypatch):
     """Reset global config manager state between tests."""
-    from tpcds_util.config import config_manager
-
-    config_manager._config = None
-    yield
-    config_manager._config = None
+    monkeypatch.setattr(config_manager, "_config", None)
+    monkeypatch.setattr(config_manager, "_password", None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_faker():
     """Create a mock Faker instance."""
     faker_mock = Mock()
@@ -1,7 +1,6 @@
 """Simple integration tests with SQLite that work with existing API."""
 
-import tempfile
-from pathlib import Path
+from itertools import islice
 from unittest.mock import patch
 
 import pytest
@@ -10,17 +9,16 @@ from tests.adapters.sqlite_adapter import SQLiteOracleAdapter
 from tpcds_util.generator import DataGenerator
 from tpcds_util.synthetic_generator import create_synthetic_data
 
+# The customer table has 18 columns
+CUSTOMER_INSERT_SQL = f"INSERT INTO customer VALUES ({','.join(['?'] * 18)})"
 
-@pytest.fixture
-def temp_output_dir():
-    """Create temporary directory for output files."""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-
-    # Cleanup
-    import shutil
 
-    shutil.rmtree(temp_dir, ignore_errors=True)
+@pytest.fixture(scope="session")
+def synthetic_dataset(tmp_path_factory):
+    """Generate the test-mode (scale 0) dataset once for read-only tests."""
+    output_dir = tmp_path_factory.mktemp("synthetic_data")
+    assert create_synthetic_data(scale=0, output_dir=str(output_dir)) is True
+    return output_dir
 
 
 @pytest.fixture
@@ -75,6 +73,19 @@ class TestSQLiteIntegration:
 
         conn.close()
 
+    def test_schema_load_inside_open_transaction(self, sqlite_adapter):
+        """Test that loading the schema works while a transaction is open."""
+        conn = sqlite_adapter.create_test_database()
+        conn.execute("CREATE TABLE scratch (id INTEGER)")
+        conn.execute("INSERT INTO scratch VALUES (1)")
+        assert conn.in_transaction
+
+        sqlite_adapter.load_tpcds_schema(conn, tables=("customer",))
+
+        assert conn.execute("SELECT COUNT(*) FROM customer").fetchone() == (0,)
+        assert conn.execute("SELECT COUNT(*) FROM scratch").fetchone() == (1,)
+        conn.close()
+
     def test_mock_oracle_connection(self, sqlite_adapter):
         """Test mock Oracle connection functionality."""
         mock_conn = sqlite_adapter.create_mock_connection()
@@ -94,95 +105,107 @@ class TestSQLiteIntegration:
         )  # SQLite may uppercase strings
         mock_conn.close()
 
+    def test_schema_qualified_dml(self):
+        """Test that DML qualified with the adapter's schema runs on SQLite."""
+        mock_conn = SQLiteOracleAdapter(schema_name="TPCDS").create_mock_connection()
+
+        cursor = mock_conn.cursor()
+        cursor.execute("CREATE TABLE TPCDS.customer (c_customer_sk INTEGER)")
+        cursor.execute("INSERT INTO TPCDS.customer VALUES (1)")
+        cursor.execute("SELECT COUNT(*) FROM TPCDS.CUSTOMER")
+        assert cursor.fetchone() == (1,)
+
+        # Column references qualified by the table name are left alone
+        cursor.execute("SELECT customer.c_customer_sk FROM tpcds.customer")
+        assert cursor.fetchone() == (1,)
+        mock_conn.close()
+
+    def test_adapted_statements_are_memoized(self):
+        """Test that DML and DDL rewrites are reused per statement and schema."""
+        adapter = SQLiteOracleAdapter(schema_name="TPCDS")
+        dml = "SELECT COUNT(*) FROM TPCDS.ITEM"
+        ddl = "CREATE TABLE TPCDS.item (i_item_sk NUMBER)"
+
+        assert adapter.adapt_sql(dml) == "SELECT COUNT(*) FROM ITEM"
+        adapter.adapt_sql(ddl)
+        with patch.object(adapter, "adapt_dml_sql") as mock_dml, patch.object(
+            adapter, "adapt_schema_sql"
+        ) as mock_ddl:
+            assert adapter.adapt_sql(dml) == "SELECT COUNT(*) FROM ITEM"
+            adapter.adapt_sql(ddl)
+        mock_dml.assert_not_called()
+        mock_ddl.assert_not_called()
+
     def test_data_generator_with_sqlite_validation(
-        self, temp_output_dir, sqlite_adapter
+        self, synthetic_dataset, sqlite_adapter
     ):
         """Test data generator with SQLite validation."""
-        # Generate synthetic data using test mode for fast execution
-        result = create_synthetic_data(scale=0, output_dir=str(temp_output_dir))
-        assert result is True
-
         # Verify files were created
-        data_files = list(temp_output_dir.glob("*.dat"))
-        assert len(data_files) > 0
+        assert next(synthetic_dataset.glob("*.dat"), None) is not None
 
         # Test loading one file into SQLite for validation
-        customer_file = temp_output_dir / "customer.dat"
-        if customer_file.exists():
-            conn = sqlite_adapter.create_test_database()
-            sqlite_adapter.load_tpcds_schema(conn)
-
-            # Load first few lines of customer data
-            cursor = conn.cursor()
-            with open(customer_file, "r") as f:
-                for i, line in enumerate(f):
-                    if i >= 5:  # Only test first 5 lines
-                        break
-
-                    fields = line.strip().split("|")[:-1]  # Remove trailing empty field
-                    if len(fields) >= 18:
-                        # Pad or truncate to match customer table structure
-                        while len(fields) < 18:
-                            fields.append("")
-                        fields = fields[:18]
-
-                        try:
-                            placeholders = ",".join(["?" for _ in range(18)])
-                            cursor.execute(
-                                f"INSERT INTO customer VALUES ({placeholders})", fields
-                            )
-                        except Exception:
-                            # Skip invalid records for this test
-                            continue
-
-            conn.commit()
-
-            # Verify some data was loaded
-            cursor.execute("SELECT COUNT(*) FROM customer")
-            count = cursor.fetchone()[0]
-            assert count > 0
-
-            conn.close()
-
-    @patch("tpcds_util.config.config_manager")
-    def test_data_generator_api_compatibility(
-        self, mock_config_manager, temp_output_dir
-    ):
+        customer_file = synthetic_dataset / "customer.dat"
+        if not customer_file.exists():
+            pytest.skip("customer.dat not generated in test mode")
+
+        conn = sqlite_adapter.create_test_database()
+        sqlite_adapter.load_tpcds_schema(conn, tables=("customer",))
+
+        # Load first few lines of customer data
+        cursor = conn.cursor()
+        rows = []
+        with open(customer_file, "r") as f:
+            for line in islice(f, 5):  # Only test first 5 lines
+                # Rows end with "|"; drop it rather than an empty last field
+                fields = line.rstrip("\n")[:-1].split("|")
+                if len(fields) >= 18:
+                    # Pad or truncate to match customer table structure
+                    while len(fields) < 18:
+                        fields.append("")
+                    rows.append(tuple(fields[:18]))
+
+        cursor.executemany(CUSTOMER_INSERT_SQL, rows)
+        conn.commit()
+
+        # Verify some data was loaded
+        cursor.execute("SELECT COUNT(*) FROM customer")
+        count = cursor.fetchone()[0]
+        assert count > 0
+
+        conn.close()
+
+    @patch("tpcds_util.generator.config_manager")
+    def test_data_generator_api_compatibility(self, mock_config_manager, tmp_path):
         """Test DataGenerator API compatibility."""
         # Mock the config manager
         from tpcds_util.config import DatabaseConfig, TPCDSConfig
 
         mock_config = TPCDSConfig(
             database=DatabaseConfig(),
-            default_output_dir=str(temp_output_dir),
+            default_output_dir=str(tmp_path),
             default_scale=1,
         )
         mock_config_manager.load.return_value = mock_config
 
         # Test DataGenerator using test mode for fast execution
         generator = DataGenerator()
-        result = generator.generate_data(scale=0, output_dir=str(temp_output_dir))
+        result = generator.generate_data(scale=0, output_dir=str(tmp_path))
 
         assert result is True
 
         # Verify files were created
-        data_files = list(temp_output_dir.glob("*.dat"))
-        assert len(data_files) > 0
+        assert next(tmp_path.glob("*.dat"), None) is not None
 
-    def test_file_format_validation(self, temp_output_dir):
+    def test_file_format_validation(self, synthetic_dataset):
         """Test generated file format validation."""
-        # Generate data using test mode for fast execution
-        result = create_synthetic_data(scale=0, output_dir=str(temp_output_dir))
-        assert result is True
-
         # Check file formats
-        for data_file in temp_output_dir.glob("*.dat"):
+        for data_file in synthetic_dataset.glob("*.dat"):
             with open(data_file, "r") as f:
-                lines = f.readlines()
+                first_line = next(f, None)
 
-                if len(lines) > 0:
+                if first_line is not None:
                     # Check TPC-DS format (pipe-delimited)
-                    first_line = lines[0].strip()
+                    first_line = first_line.strip()
                     assert "|" in first_line
                     assert first_line.endswith("|")
 
@@ -192,96 +215,89 @@ class TestSQLiteIntegration:
                         len(fields) >= 3
                     )  # Should have multiple fields (some tables like income_band have few fields)
 
-    def test_data_quality_basic_checks(self, temp_output_dir, sqlite_adapter):
+    def test_data_quality_basic_checks(self, synthetic_dataset, sqlite_adapter):
         """Test basic data quality checks."""
-        # Generate small dataset using test mode for fast execution
-        result = create_synthetic_data(scale=0, output_dir=str(temp_output_dir))
-        assert result is True
-
         # Check customer data quality if available
-        customer_file = temp_output_dir / "customer.dat"
-        if customer_file.exists():
-            conn = sqlite_adapter.create_test_database()
-            cursor = conn.cursor()
-
-            # Create simplified customer table for testing
-            cursor.execute(
-                """
-                CREATE TABLE customer_test (
-                    c_customer_sk INTEGER,
-                    c_customer_id TEXT,
-                    c_first_name TEXT,
-                    c_last_name TEXT
-                )
+        customer_file = synthetic_dataset / "customer.dat"
+        if not customer_file.exists():
+            pytest.skip("customer.dat not generated in test mode")
+
+        conn = sqlite_adapter.create_test_database()
+        cursor = conn.cursor()
+
+        # Create simplified customer table for testing
+        cursor.execute(
             """
+            CREATE TABLE customer_test (
+                c_customer_sk INTEGER,
+                c_customer_id TEXT,
+                c_first_name TEXT,
+                c_last_name TEXT
             )
+        """
+        )
 
-            # Load sample data
-            with open(customer_file, "r") as f:
-                for i, line in enumerate(f):
-                    if i >= 10:  # Test first 10 records
-                        break
-
-                    fields = line.strip().split("|")
-                    if len(fields) >= 9:  # Has enough fields
-                        try:
-                            cursor.execute(
-                                "INSERT INTO customer_test VALUES (?, ?, ?, ?)",
-                                (fields[0], fields[1], fields[7], fields[8]),
-                            )
-                        except Exception:
-                            continue
-
-            conn.commit()
-
-            # Basic quality checks
-            cursor.execute(
-                "SELECT COUNT(*) FROM customer_test WHERE c_customer_sk IS NOT NULL"
-            )
-            valid_sks = cursor.fetchone()[0]
+        # Load sample data
+        with open(customer_file, "r") as f:
+            for line in islice(f, 10):  # Test first 10 records
+                fields = line.rstrip("\n")[:-1].split("|")
+                if len(fields) >= 9:  # Has enough fields
+                    try:
+                        cursor.execute(
+                            "INSERT INTO customer_test VALUES (?, ?, ?, ?)",
+                            (fields[0], fields[1], fields[7], fields[8]),
+                        )
+                    except Exception:
+                        continue
+
+        conn.commit()
+
+        # Basic quality checks
+        cursor.execute(
+            "SELECT COUNT(*) FROM customer_test WHERE c_customer_sk IS NOT NULL"
+        )
+        valid_sks = cursor.fetchone()[0]
 
-            cursor.execute("SELECT COUNT(*) FROM customer_test")
-            total_records = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM customer_test")
+        total_records = cursor.fetchone()[0]
 
-            if total_records > 0:
-                # At least 80% should have valid SKs
-                quality_ratio = valid_sks / total_records
-                assert quality_ratio >= 0.8
+        if total_records > 0:
+            # At least 80% should have valid SKs
+            quality_ratio = valid_sks / total_records
+            assert quality_ratio >= 0.8
 
-            conn.close()
+        conn.close()
 
 
 class TestSQLitePerformance:
     """Test performance aspects of SQLite integration."""
 
-    def test_data_generation_performance(self, temp_output_dir):
+    def test_data_generation_performance(self, tmp_path):
         """Test that data generation completes in reasonable time."""
         import time
 
         start_time = time.time()
-        result = create_synthetic_data(scale=0, output_dir=str(temp_output_dir))
+        result = create_synthetic_data(scale=0, output_dir=str(tmp_path))
         generation_time = time.time() - start_time
 
         assert result is True
         assert generation_time < 5  # Test mode should complete within 5 seconds
 
-    def test_scale_modes_functionality(self, temp_output_dir):
+    def test_scale_modes_functionality(self, synthetic_dataset):
         """Test that scale=0 (test mode) works correctly."""
         # Test scale=0 (test mode) only - fast execution for CI/CD
-        test_dir_0 = temp_output_dir / "scale_0"
-        result_0 = create_synthetic_data(scale=0, output_dir=str(test_dir_0))
-        assert result_0 is True
-
-        files_0 = list(test_dir_0.glob("*.dat"))
+        files_0 = list(synthetic_dataset.glob("*.dat"))
         assert len(files_0) >= 10  # Should have essential tables
         assert len(files_0) <= 15  # Should be limited for test mode
 
         # Verify test mode generates small files
-        customer_0 = test_dir_0 / "customer.dat"
-        if customer_0.exists():
-            with open(customer_0, "r") as f:
-                line_count = len(f.readlines())
-            assert line_count <= 10  # Test mode should have very few records
+        customer_0 = synthetic_dataset / "customer.dat"
+        if not customer_0.exists():
+            pytest.skip("customer.dat not generated in test mode")
+
+        with open(customer_0, "r") as f:
+            line_count = sum(1 for _ in f)
+        assert line_count <= 10  # Test mode should have very few records
 
     def test_sqlite_operations_performance(self, sqlite_adapter):
         """Test SQLite operations performance."""
@@ -299,16 +315,13 @@ class TestSQLitePerformance:
         cursor = conn.cursor()
         start_time = time.time()
 
-        for i in range(1000):
-            cursor.execute(
-                "INSERT INTO customer VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                [i, f"CUSTOMER{i:06d}"] + [""] * 16,
-            )
+        rows = [(i, f"CUSTOMER{i:06d}", *[""] * 16) for i in range(100)]
+        cursor.executemany(CUSTOMER_INSERT_SQL, rows)
 
         conn.commit()
         insert_time = time.time() - start_time
 
-        assert insert_time < 5  # 1000 inserts should complete within 5 seconds
+        assert insert_time < 1  # 100 batched inserts should take milliseconds
 
         conn.close()
 
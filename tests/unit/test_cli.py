@@ -1,57 +1,112 @@
 """Unit tests for CLI module."""
 
+import subprocess
+import sys
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
-from tpcds_util.cli import cli, config, config_show
+from tpcds_util.cli import cli, config_show, db_info
 from tpcds_util.config import DatabaseConfig, TPCDSConfig
 
+# Configs returned by the mocked config_manager; config show only reads them,
+# so the tests share one instance of each.
+_CFG_FULL = TPCDSConfig(
+    database=DatabaseConfig(
+        host="testhost",
+        port=1521,
+        service_name="TESTPDB",
+        username="testuser",
+        password="testpass",
+    ),
+    schema_name="TEST_SCHEMA",
+    default_scale=2,
+    default_output_dir="/test/path",
+    parallel_workers=8,
+)
+
+_CFG_EMPTY = TPCDSConfig(
+    database=DatabaseConfig(
+        host="localhost",
+        port=1521,
+        service_name="orcl",
+        username="",
+        password="",
+    ),
+    schema_name="",
+    default_scale=1,
+    default_output_dir="./tpcds_data",
+    parallel_workers=4,
+)
+
+_CFG_INT = TPCDSConfig(
+    database=DatabaseConfig(
+        host="integrationhost",
+        port=1522,
+        service_name="INTPDB",
+        username="intuser",
+        password="intpass",
+    ),
+    schema_name="INT_SCHEMA",
+    default_scale=3,
+    default_output_dir="/int/path",
+    parallel_workers=6,
+)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Click test runner shared by the CLI tests; invoke() isolates each run."""
+    return CliRunner()
+
 
 class TestCLI:
     """Test CLI module."""
 
-    def test_cli_group_exists(self):
-        """Test that main CLI group exists and is callable."""
-        assert callable(cli)
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            (
+                ["--help"],
+                (
+                    "TPC-DS Utility",
+                    "Generate synthetic TPC-DS data",
+                    "manage Oracle databases",
+                    "schema",
+                    "config",  # Subcommands are listed
+                ),
+            ),
+            (["config", "--help"], ("Manage configuration settings", "show")),
+            (["config", "show", "--help"], ("Show current configuration",)),
+        ],
+    )
+    def test_help_output(self, runner, args, expected):
+        """Test help output of the CLI group and its config subcommands."""
+        result = runner.invoke(cli, args)
 
         assert result.exit_code == 0
-        assert "TPC-DS Utility" in result.output
-        assert "synthetic TPC-DS data" in result.output
-
-    def test_config_group_exists(self):
-        """Test that config command group exists."""
-        assert callable(config)
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "--help"])
+        for text in expected:
+            assert text in result.output
+
+    def test_cli_import_is_lazy(self):
+        """Test that importing the CLI does not load heavy dependencies."""
+        code = (
+            "import sys, tpcds_util.cli; "
+            "print([m for m in ('oracledb', 'rich') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
 
-        assert result.exit_code == 0
-        assert "Manage configuration settings" in result.output
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
 
     @patch("tpcds_util.cli.config_manager")
-    def test_config_show_command(self, mock_config_manager):
+    def test_config_show_command(self, mock_config_manager, runner):
         """Test config show command."""
-        # Setup mock configuration
-        mock_config = TPCDSConfig(
-            database=DatabaseConfig(
-                host="testhost",
-                port=1521,
-                service_name="TESTPDB",
-                username="testuser",
-                password="testpass",
-            ),
-            schema_name="TEST_SCHEMA",
-            default_scale=2,
-            default_output_dir="/test/path",
-            parallel_workers=8,
-        )
-        mock_config_manager.load.return_value = mock_config
+        mock_config_manager.load.return_value = _CFG_FULL
 
-        runner = CliRunner()
         result = runner.invoke(config_show)
 
         assert result.exit_code == 0
@@ -69,25 +124,10 @@ class TestCLI:
         assert "8" in result.output  # parallel workers
 
     @patch("tpcds_util.cli.config_manager")
-    def test_config_show_empty_values(self, mock_config_manager):
+    def test_config_show_empty_values(self, mock_config_manager, runner):
         """Test config show with empty/default values."""
-        # Setup mock configuration with empty values
-        mock_config = TPCDSConfig(
-            database=DatabaseConfig(
-                host="localhost",
-                port=1521,
-                service_name="orcl",
-                username="",
-                password="",
-            ),
-            schema_name="",
-            default_scale=1,
-            default_output_dir="./tpcds_data",
-            parallel_workers=4,
-        )
-        mock_config_manager.load.return_value = mock_config
+        mock_config_manager.load.return_value = _CFG_EMPTY
 
-        runner = CliRunner()
         result = runner.invoke(config_show)
 
         assert result.exit_code == 0
@@ -99,107 +139,143 @@ class TestCLI:
         assert "localhost" in result.output
         assert "orcl" in result.output
 
-    def test_cli_version_option(self):
+    def test_cli_version_option(self, runner):
         """Test that version option works."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
         # Version output format may vary, just check it doesn't crash
 
-    def test_cli_help_message_content(self):
-        """Test CLI help message contains expected information."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
 
-        assert result.exit_code == 0
-        assert "TPC-DS Utility" in result.output
-        assert "Generate synthetic TPC-DS data" in result.output
-        assert "manage Oracle databases" in result.output
-        assert "schema" in result.output
+class TestCLIIntegration:
+    """Integration-style tests for CLI components."""
 
-        # Check that subcommands are listed
-        assert "config" in result.output
+    @patch("tpcds_util.cli.config_manager")
+    @patch("tpcds_util.cli.get_console")
+    def test_config_show_table_creation(
+        self, mock_get_console, mock_config_manager, runner
+    ):
+        """Test that config show creates a proper table output."""
+        mock_config_manager.load.return_value = _CFG_INT
 
-    def test_config_help_message(self):
-        """Test config subcommand help message."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "--help"])
+        result = runner.invoke(config_show)
 
         assert result.exit_code == 0
-        assert "Manage configuration settings" in result.output
-        assert "show" in result.output  # show subcommand should be listed
+        mock_config_manager.load.assert_called_once()
 
-    def test_config_show_help(self):
-        """Test config show subcommand help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "show", "--help"])
+        # Check that console.print was called (for the table)
+        mock_get_console.return_value.print.assert_called()
+
+    @patch("tpcds_util.database.db_manager")
+    def test_db_info_streams_table_rows(self, mock_db_manager, runner):
+        """Test that db info renders the rows yielded by iter_table_info."""
+        mock_db_manager.iter_table_info.return_value = iter(
+            [
+                {
+                    "TABLE_NAME": "CUSTOMER",
+                    "NUM_ROWS": 1234,
+                    "BLOCKS": 8,
+                    "AVG_ROW_LEN": 120,
+                },
+                {"TABLE_NAME": "ITEM", "NUM_ROWS": 0, "BLOCKS": None, "AVG_ROW_LEN": 0},
+            ]
+        )
+
+        result = runner.invoke(db_info, ["--schema", "TPCDSV1"])
 
         assert result.exit_code == 0
-        assert "Show current configuration" in result.output
+        mock_db_manager.iter_table_info.assert_called_once_with("TPCDSV1")
+        assert "CUSTOMER" in result.output
+        assert "1234" in result.output
+        assert "ITEM" in result.output
 
+    @patch("tpcds_util.database.db_manager")
+    def test_db_info_no_tables(self, mock_db_manager, runner):
+        """Test db info message when no TPC-DS tables exist."""
+        mock_db_manager.iter_table_info.return_value = iter([])
 
-class TestCLIIntegration:
-    """Integration-style tests for CLI components."""
+        result = runner.invoke(db_info)
+
+        assert result.exit_code == 0
+        assert "No TPC-DS tables found" in result.output
 
     @patch("tpcds_util.cli.config_manager")
-    @patch("tpcds_util.cli.console")
-    def test_config_show_table_creation(self, mock_console, mock_config_manager):
-        """Test that config show creates a proper table output."""
-        mock_config = TPCDSConfig(
-            database=DatabaseConfig(
-                host="integrationhost",
-                port=1522,
-                service_name="INTPDB",
-                username="intuser",
-                password="intpass",
-            ),
-            schema_name="INT_SCHEMA",
-            default_scale=3,
-            default_output_dir="/int/path",
-            parallel_workers=6,
+    @patch("tpcds_util.database.db_manager")
+    def test_status_reports_probes(
+        self, mock_db_manager, mock_config_manager, mock_tpcds_config, runner
+    ):
+        """Test status output from the concurrent database probes."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        mock_db_manager.test_connection.return_value = True
+        mock_db_manager.get_table_info.return_value = [{"TABLE_NAME": "ITEM"}]
+
+        result = runner.invoke(cli, ["status"])
+
+        assert result.exit_code == 0
+        assert "Database: Connected" in result.output
+        assert "Schema: 1 tables found" in result.output
+        mock_db_manager.test_connection.assert_called_once()
+        mock_db_manager.get_table_info.assert_called_once()
+
+    @patch("tpcds_util.database.db_manager")
+    def test_db_info_raw_output(self, mock_db_manager, runner):
+        """Test that --raw prints tab-separated rows."""
+        mock_db_manager.iter_table_info.return_value = iter(
+            [{"TABLE_NAME": "ITEM", "NUM_ROWS": 5, "BLOCKS": 1, "AVG_ROW_LEN": 90}]
         )
-        mock_config_manager.load.return_value = mock_config
 
-        runner = CliRunner()
-        result = runner.invoke(config_show)
+        result = runner.invoke(db_info, ["--raw"])
 
         assert result.exit_code == 0
-        mock_config_manager.load.assert_called_once()
+        assert result.output.splitlines() == [
+            "Table Name\tRows\tBlocks\tAvg Row Length",
+            "ITEM\t5\t1\t90",
+        ]
+
+    @patch("tpcds_util.cli.MAX_RICH_ROWS", 1)
+    @patch("tpcds_util.database.db_manager")
+    def test_db_info_truncates_large_tables(self, mock_db_manager, runner):
+        """Test that rows beyond MAX_RICH_ROWS are summarized."""
+        mock_db_manager.iter_table_info.return_value = iter(
+            [
+                {"TABLE_NAME": name, "NUM_ROWS": 1, "BLOCKS": 1, "AVG_ROW_LEN": 1}
+                for name in ("CUSTOMER", "ITEM", "STORE")
+            ]
+        )
 
-        # Check that console.print was called (for the table)
-        mock_console.print.assert_called()
+        result = runner.invoke(db_info)
+
+        assert result.exit_code == 0
+        assert "CUSTOMER" in result.output
+        assert "STORE" not in result.output
+        assert "2 more rows" in result.output
 
-    def test_invalid_command(self):
+    def test_invalid_command(self, runner):
         """Test behavior with invalid command."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["invalid-command"])
 
         assert result.exit_code != 0
         assert "No such command" in result.output
 
-    def test_config_invalid_subcommand(self):
+    def test_config_invalid_subcommand(self, runner):
         """Test behavior with invalid config subcommand."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["config", "invalid-subcommand"])
 
         assert result.exit_code != 0
         assert "No such command" in result.output
 
     @patch("tpcds_util.cli.config_manager")
-    def test_config_show_with_exception(self, mock_config_manager):
+    def test_config_show_with_exception(self, mock_config_manager, runner):
         """Test config show when config manager raises exception."""
         mock_config_manager.load.side_effect = Exception("Config error")
 
-        runner = CliRunner()
         result = runner.invoke(config_show)
 
         # Should not crash, but may have non-zero exit code depending on implementation
         assert "Config error" in str(result.exception) if result.exception else True
 
-    def test_empty_cli_invocation(self):
+    def test_empty_cli_invocation(self, runner):
         """Test calling CLI without any commands."""
-        runner = CliRunner()
         result = runner.invoke(cli, [])
 
         # Should show help or usage information (Click returns 2 for missing command)
@@ -0,0 +1,37 @@
+"""Unit tests for config module."""
+
+from unittest.mock import patch
+
+
+class TestConfigManager:
+    """Test ConfigManager."""
+
+    def test_get_password_from_config_is_cached(self, mock_config_manager, monkeypatch):
+        """Test that the resolved password is reused."""
+        monkeypatch.delenv("TPCDS_DB_PASSWORD", raising=False)
+        with patch("click.prompt") as mock_prompt:
+            assert mock_config_manager.get_password() == "testpass"
+            mock_config_manager._config.database.password = "changed"
+            assert mock_config_manager.get_password() == "testpass"
+
+        mock_prompt.assert_not_called()
+
+    def test_get_password_prompts_once(self, mock_config_manager, monkeypatch):
+        """Test that the user is prompted only once per process."""
+        monkeypatch.delenv("TPCDS_DB_PASSWORD", raising=False)
+        mock_config_manager._config.database.password = ""
+
+        with patch("click.prompt", return_value="secret") as mock_prompt:
+            assert mock_config_manager.get_password() == "secret"
+            assert mock_config_manager.get_password() == "secret"
+
+        mock_prompt.assert_called_once()
+
+    def test_update_clears_cached_password(self, mock_config_manager, monkeypatch):
+        """Test that changing database settings re-resolves the password."""
+        monkeypatch.delenv("TPCDS_DB_PASSWORD", raising=False)
+        assert mock_config_manager.get_password() == "testpass"
+
+        mock_config_manager.update(password="newpass")
+
+        assert mock_config_manager.get_password() == "newpass"
@@ -0,0 +1,562 @@
+"""Unit tests for database module."""
+
+from dataclasses import replace
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import oracledb
+import pytest
+
+from tpcds_util.database import (
+    DatabaseManager,
+    _parse_insert_values,
+    _parse_sql_file,
+)
+
+SCHEMA_FILE = Path(__file__).parent.parent.parent / "oracle_tpcds_schema.sql"
+
+
+def _manager_with_cursor(cursor):
+    """DatabaseManager whose connections all hand out the given cursor."""
+    manager = DatabaseManager()
+    connection = MagicMock()
+    connection.cursor.return_value.__enter__.return_value = cursor
+    manager.get_connection = MagicMock()
+    manager.get_connection.return_value.__enter__.return_value = connection
+    return manager
+
+
+class TestSplitSQLStatements:
+    """Test SQL script splitting."""
+
+    def test_regular_statements(self):
+        """Test that statements are split on trailing semicolons."""
+        lines = [
+            "-- comment",
+            "create table a (id number);",
+            "",
+            "create table b",
+            "(",
+            "    id number",
+            ");",
+        ]
+
+        statements = DatabaseManager()._split_sql_statements(lines)
+
+        assert statements == [
+            "create table a (id number)",
+            "create table b\n(\nid number\n)",
+        ]
+
+    def test_plsql_block_keeps_inner_semicolons(self):
+        """Test that PL/SQL blocks run until a lone slash."""
+        lines = [
+            "BEGIN",
+            "   EXECUTE IMMEDIATE 'DROP TABLE x';",
+            "END;",
+            "/",
+            "select 1 from dual;",
+        ]
+
+        statements = DatabaseManager()._split_sql_statements(lines)
+
+        assert statements == [
+            "BEGIN\nEXECUTE IMMEDIATE 'DROP TABLE x';\nEND;",
+            "select 1 from dual",
+        ]
+
+    def test_keyword_inside_identifier_is_not_plsql(self):
+        """Test that identifiers containing BEGIN do not start a block."""
+        statements = DatabaseManager()._split_sql_statements(
+            [
+                "create table promo",
+                "(",
+                "    p_begin_date_sk number",
+                ");",
+                "drop table x;",
+            ]
+        )
+
+        assert statements == [
+            "create table promo\n(\np_begin_date_sk number\n)",
+            "drop table x",
+        ]
+
+    def test_multiline_statement_keeps_line_breaks(self):
+        """Test that the final line is not glued onto the previous one."""
+        statements = DatabaseManager()._split_sql_statements(
+            ["select *", "from dual", "where 1 = 1;"]
+        )
+
+        assert statements == ["select *\nfrom dual\nwhere 1 = 1"]
+
+    def test_string_literals_and_inline_comments(self):
+        """Test that quoted terminators survive and trailing comments go."""
+        statements = DatabaseManager()._split_sql_statements(
+            [
+                "insert into t values ('a;b', '--x'); -- trailing note",
+                "insert into t values ('it''s",
+                "still; quoted');",
+            ]
+        )
+
+        assert statements == [
+            "insert into t values ('a;b', '--x')",
+            "insert into t values ('it''s\nstill; quoted')",
+        ]
+
+    def test_schema_file(self):
+        """Test splitting the bundled Oracle TPC-DS schema."""
+        with open(SCHEMA_FILE, "r") as f:
+            statements = DatabaseManager()._split_sql_statements(f)
+
+        create_tables = [s for s in statements if s.lower().startswith("create table")]
+        assert len(create_tables) == 25
+        assert statements[0].startswith("BEGIN")
+        assert statements[-1].startswith("BEGIN")
+        assert statements[-1].endswith("END;")
+
+    def test_parse_is_memoized_per_file_version(self, tmp_path):
+        """Test that an unchanged file is parsed once and an edit re-parses."""
+        sql_file = tmp_path / "schema.sql"
+        sql_file.write_text("create table a (id number);\n")
+
+        def parse():
+            stat = sql_file.stat()
+            return _parse_sql_file(str(sql_file), stat.st_mtime_ns, stat.st_size)
+
+        first = parse()
+        assert parse() is first
+
+        sql_file.write_text("create table a (id number);\ndrop table b;\n")
+        assert parse() == ("create table a (id number)", "drop table b")
+
+
+class TestQualifySQLForSchema:
+    """Test rewriting the schema script for a target schema."""
+
+    def test_tables_and_cleanup_query_are_qualified(self):
+        """Test that table DDL and the user_tables lookup target the schema."""
+        sql = (
+            "CREATE TABLE customer_address (ca number);\n"
+            "create table customer (c number);\n"
+            "drop table store;\n"
+            "SELECT table_name FROM user_tables WHERE table_name = 'X'"
+        )
+
+        qualified = DatabaseManager()._qualify_sql_for_schema(sql, "TPCDS")
+
+        assert qualified == (
+            "create table TPCDS.CUSTOMER_ADDRESS (ca number);\n"
+            "create table TPCDS.CUSTOMER (c number);\n"
+            "drop table TPCDS.STORE;\n"
+            "SELECT table_name FROM all_tables WHERE owner = 'TPCDS' AND "
+            "table_name = 'X'"
+        )
+
+
+class TestInsertBatching:
+    """Test grouping of INSERT statements for executemany."""
+
+    def test_parse_literal_insert(self):
+        """Test that literal values are turned into binds."""
+        bind_sql, values = _parse_insert_values(
+            "INSERT INTO reason (r_reason_sk, r_reason_id, r_reason_desc)\n"
+            "VALUES (1, 'Didn''t fit', NULL)"
+        )
+
+        assert bind_sql == (
+            "INSERT INTO reason (r_reason_sk, r_reason_id, r_reason_desc) "
+            "VALUES (:1, :2, :3)"
+        )
+        assert values == [Decimal("1"), "Didn't fit", None]
+
+    def test_parse_rejects_expressions(self):
+        """Test that statements with non-literal values are left alone."""
+        assert _parse_insert_values("INSERT INTO t VALUES (SYSDATE)") is None
+        assert _parse_insert_values("INSERT INTO t SELECT * FROM s") is None
+        assert _parse_insert_values("create table t (id number)") is None
+
+    def test_consecutive_inserts_are_grouped(self):
+        """Test that only runs of same-shaped inserts are batched."""
+        statements = [
+            "create table t (id number, name varchar2(10))",
+            "insert into t values (1, 'a')",
+            "insert into t values (2, 'b')",
+            "insert into t values (3)",
+        ]
+
+        batches = list(DatabaseManager()._batch_statements(statements))
+
+        assert [(start, len(batch)) for start, batch, _, _ in batches] == [
+            (0, 1),
+            (1, 2),
+            (3, 1),
+        ]
+        assert batches[0][2] is None
+        assert batches[1][2] == "insert into t values (:1, :2)"
+        assert batches[1][3] == [[Decimal("1"), "a"], [Decimal("2"), "b"]]
+        assert batches[2][2] is None
+
+    def test_consecutive_ddl_is_grouped(self):
+        """Test that plain DDL runs are grouped and PL/SQL stays alone."""
+        statements = [
+            "create table a (id number)",
+            "create table b (id number)",
+            "BEGIN\nNULL;\nEND;",
+            "create table c (id number)",
+        ]
+
+        batches = list(DatabaseManager()._batch_statements(statements))
+
+        assert [(start, len(batch)) for start, batch, _, _ in batches] == [
+            (0, 2),
+            (2, 1),
+            (3, 1),
+        ]
+
+    def test_ddl_block_reports_failed_statements(self):
+        """Test that a DDL run is one execute and failures map back by offset."""
+        failed = Mock()
+        failed.getvalue.return_value = "1|ORA-00955: name is already used\n"
+        cursor = Mock()
+        cursor.var.return_value = failed
+
+        failures = DatabaseManager()._execute_ddl_block(
+            cursor, ["create table a (id number)", "create table b (x char(1))"]
+        )
+
+        cursor.execute.assert_called_once()
+        block = cursor.execute.call_args[0][0]
+        assert "run(0, q'[create table a (id number)]');" in block
+        assert failures == [(1, "ORA-00955: name is already used")]
+
+
+class TestExecuteSQLFile:
+    """Test error handling for batched statements in execute_sql_file."""
+
+    @patch("tpcds_util.database.console")
+    def test_failed_insert_run_is_retried_per_statement(self, mock_console, tmp_path):
+        """Test that a whole-call executemany failure reports each statement."""
+        mock_console.is_terminal = False
+        sql_file = tmp_path / "inserts.sql"
+        sql_file.write_text(
+            "insert into t values (1);\n"
+            "insert into t values ('x');\n"
+            "insert into t values (3);\n"
+        )
+        cursor = MagicMock()
+        cursor.executemany.side_effect = oracledb.Error("DPY-3013: type mismatch")
+        cursor.execute.side_effect = [None, oracledb.Error("ORA-01722"), None]
+        manager = _manager_with_cursor(cursor)
+
+        assert manager.execute_sql_file(sql_file) is True
+
+        cursor.executemany.assert_called_once()
+        assert [c.args[0] for c in cursor.execute.call_args_list] == [
+            "insert into t values (1)",
+            "insert into t values ('x')",
+            "insert into t values (3)",
+        ]
+        printed = [c.args[0] for c in mock_console.print.call_args_list]
+        assert "Error in statement 2: ORA-01722" in printed
+
+    @patch("tpcds_util.database.console")
+    def test_failed_ddl_block_is_retried_per_statement(self, mock_console, tmp_path):
+        """Test that a DDL block that fails to run falls back to single executes."""
+        mock_console.is_terminal = False
+        sql_file = tmp_path / "ddl.sql"
+        sql_file.write_text(
+            "create table a (id number);\n"
+            "create table b (id number);\n"
+            "create table c (id number);\n"
+        )
+        cursor = MagicMock()
+        cursor.execute.side_effect = [
+            oracledb.Error("PLS-00103: Encountered the symbol"),
+            None,
+            oracledb.Error("ORA-00955: name is already used"),
+            None,
+        ]
+        manager = _manager_with_cursor(cursor)
+
+        assert manager.execute_sql_file(sql_file) is True
+
+        assert [c.args[0] for c in cursor.execute.call_args_list[1:]] == [
+            "create table a (id number)",
+            "create table b (id number)",
+            "create table c (id number)",
+        ]
+        printed = [c.args[0] for c in mock_console.print.call_args_list]
+        assert "Error in statement 2: ORA-00955: name is already used" in printed
+
+
+class TestDropTables:
+    """Test the batched table drop."""
+
+    def test_single_round_trip_and_failure_parsing(self):
+        """Test that all drops go out in one execute and failures are parsed."""
+        dropped = Mock()
+        dropped.getvalue.return_value = 1
+        failed = Mock()
+        failed.getvalue.return_value = (
+            "OTHER.STORE|ORA-01031: insufficient privileges\n"
+        )
+        cursor = Mock()
+        cursor.var.side_effect = [dropped, failed]
+
+        count, failures = DatabaseManager()._drop_tables(
+            cursor, ["OTHER.STORE_SALES", "OTHER.STORE"]
+        )
+
+        cursor.execute.assert_called_once()
+        block = cursor.execute.call_args[0][0]
+        assert "name_list('OTHER.STORE_SALES', 'OTHER.STORE')" in block
+        assert count == 1
+        assert failures == [("OTHER.STORE", "ORA-01031: insufficient privileges")]
+
+
+class TestConnectionPool:
+    """Test pooled connection handling."""
+
+    @patch("tpcds_util.database.config_manager")
+    @patch("tpcds_util.database.oracledb.create_pool")
+    def test_pool_created_once_and_connections_released(
+        self, mock_create_pool, mock_config_manager, mock_tpcds_config
+    ):
+        """Test that connections are acquired from one lazily created pool."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        mock_config_manager.get_password.return_value = "testpass"
+        pool = mock_create_pool.return_value
+        manager = DatabaseManager()
+
+        connection = pool.acquire.return_value
+        with manager.get_connection() as first:
+            assert first is connection
+        with manager.get_connection():
+            pass
+
+        mock_create_pool.assert_called_once()
+        assert mock_create_pool.call_args.kwargs["dsn"] == "test-host:1521/TESTPDB"
+        assert mock_create_pool.call_args.kwargs["stmtcachesize"] == 50
+        assert connection.close.call_count == 2
+        pool.drop.assert_not_called()
+        mock_config_manager.get_password.assert_called_once()
+
+    @patch("tpcds_util.database.config_manager")
+    @patch("tpcds_util.database.oracledb.create_pool")
+    def test_rejected_password_is_forgotten(
+        self, mock_create_pool, mock_config_manager, mock_tpcds_config
+    ):
+        """Test that ORA-01017 on acquire clears the password and the pool."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        pool = mock_create_pool.return_value
+        pool.acquire.side_effect = oracledb.DatabaseError(
+            "ORA-01017: invalid username/password; logon denied"
+        )
+        manager = DatabaseManager()
+
+        with pytest.raises(oracledb.DatabaseError):
+            with manager.get_connection():
+                pass
+
+        mock_config_manager.clear_password.assert_called_once()
+        pool.close.assert_called_once_with(force=True)
+        assert manager._pool is None
+
+    @pytest.mark.parametrize("hints", [True, False])
+    @patch("tpcds_util.database.config_manager")
+    @patch("tpcds_util.database.oracledb.create_pool")
+    def test_metadata_hints_do_not_return_to_pool(
+        self, mock_create_pool, mock_config_manager, mock_tpcds_config, hints
+    ):
+        """Test that a session altered by the metadata hints leaves the pool."""
+        mock_config_manager.load.return_value = replace(
+            mock_tpcds_config, metadata_optimizer_hints=hints
+        )
+        pool = mock_create_pool.return_value
+        connection = pool.acquire.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = []
+
+        assert list(DatabaseManager().iter_table_info()) == []
+
+        if hints:
+            assert "ALTER SESSION" in cursor.execute.call_args_list[0].args[0]
+            pool.drop.assert_called_once_with(connection)
+            connection.close.assert_not_called()
+        else:
+            pool.drop.assert_not_called()
+            connection.close.assert_called_once()
+
+    @patch("tpcds_util.database.atexit.register")
+    @patch("tpcds_util.database.config_manager")
+    @patch("tpcds_util.database.oracledb.create_pool")
+    def test_close_drains_pool(
+        self, mock_create_pool, mock_config_manager, mock_register, mock_tpcds_config
+    ):
+        """Test that close() releases the pool and a new one is built on demand."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        manager = DatabaseManager()
+
+        pool = manager._get_pool()
+        manager.close()
+        manager.close()
+
+        pool.close.assert_called_once_with(force=True)
+        manager._get_pool()
+        assert mock_create_pool.call_count == 2
+        mock_register.assert_called_once_with(manager.close)
+
+
+class TestDropSchema:
+    """Test drop_schema round-trips."""
+
+    def test_single_round_trip_for_all_tables(self, mock_tpcds_config):
+        """Test that the drop block alone handles existing and missing tables."""
+        cursor = MagicMock()
+        dropped, failed = Mock(), Mock()
+        dropped.getvalue.return_value = 2
+        failed.getvalue.return_value = None
+        cursor.var.side_effect = [dropped, failed]
+        manager = _manager_with_cursor(cursor)
+
+        with patch("tpcds_util.database.config_manager") as mock_config_manager:
+            mock_config_manager.load.return_value = mock_tpcds_config
+            assert manager.drop_schema(confirm=True) is True
+
+        cursor.execute.assert_called_once()
+        block = cursor.execute.call_args[0][0]
+        assert "name_list('TEST_SCHEMA.STORE_RETURNS', " in block
+        assert "'TEST_SCHEMA.DBGEN_VERSION')" in block
+
+    def test_nothing_to_drop(self, mock_tpcds_config):
+        """Test that an empty schema is reported and still succeeds."""
+        cursor = MagicMock()
+        dropped, failed = Mock(), Mock()
+        dropped.getvalue.return_value = 0
+        failed.getvalue.return_value = None
+        cursor.var.side_effect = [dropped, failed]
+        manager = _manager_with_cursor(cursor)
+
+        with patch("tpcds_util.database.config_manager") as mock_config_manager:
+            mock_config_manager.load.return_value = mock_tpcds_config
+            with patch("tpcds_util.database.console") as mock_console:
+                assert manager.drop_schema(confirm=True) is True
+
+        assert "No TPC-DS tables found" in mock_console.print.call_args[0][0]
+
+
+class TestCreatePrivileges:
+    """Test the create-privilege probe."""
+
+    @patch("tpcds_util.database.config_manager")
+    def test_own_schema_skips_probe(self, mock_config_manager, mock_tpcds_config):
+        """Test that no test table is created in the user's own schema."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        manager = DatabaseManager()
+        manager.get_connection = MagicMock()
+
+        assert manager._check_create_privileges("TESTUSER") is True
+        manager.get_connection.assert_not_called()
+
+
+class TestCreateSchemaPreflight:
+    """Test the checks create_schema runs before executing DDL."""
+
+    def _manager(self, user_exists, probe_results):
+        manager = DatabaseManager()
+        manager._check_schema_user_exists = Mock(return_value=user_exists)
+        manager._check_create_privileges = Mock(side_effect=probe_results)
+        manager._create_schema_user = Mock(return_value=True)
+        manager.execute_sql_file = Mock(return_value=True)
+        return manager
+
+    def test_existing_user_probed_once(self):
+        """Test that an existing user needs a single privilege probe."""
+        manager = self._manager(True, [True])
+
+        assert manager.create_schema(SCHEMA_FILE, schema_override="tpcds") is True
+
+        manager._create_schema_user.assert_not_called()
+        manager._check_create_privileges.assert_called_once_with("TPCDS")
+
+    def test_new_user_is_probed_again(self):
+        """Test that the probe is repeated after creating the user."""
+        manager = self._manager(False, [False, True])
+
+        assert manager.create_schema(SCHEMA_FILE, schema_override="tpcds") is True
+
+        manager._create_schema_user.assert_called_once_with("TPCDS")
+        assert manager._check_create_privileges.call_count == 2
+
+
+class TestCreateSchemaUser:
+    """Test schema user creation."""
+
+    @patch("tpcds_util.database.config_manager")
+    @patch("tpcds_util.database.oracledb.connect")
+    def test_privileges_granted_in_one_statement(
+        self, mock_connect, mock_config_manager, mock_tpcds_config
+    ):
+        """Test that all privileges go out in a single GRANT."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (1,)
+
+        assert DatabaseManager()._create_schema_user("TPCDS", "secret") is True
+
+        grants = [c[0][0] for c in cursor.execute.call_args_list if "GRANT" in c[0][0]]
+        assert grants == [
+            "GRANT CREATE SESSION, CREATE TABLE, CREATE SEQUENCE, CREATE VIEW, "
+            "CREATE PROCEDURE, CREATE TRIGGER, CREATE SYNONYM, "
+            "UNLIMITED TABLESPACE TO TPCDS"
+        ]
+
+
+class TestTableInfoCache:
+    """Test the per-schema table info cache."""
+
+    @patch("tpcds_util.database.config_manager")
+    def test_results_reused_until_cleared(self, mock_config_manager, mock_tpcds_config):
+        """Test that repeated lookups hit the cache until it is cleared."""
+        mock_config_manager.load.return_value = mock_tpcds_config
+        manager = DatabaseManager()
+        manager.iter_table_info = Mock(return_value=iter([{"TABLE_NAME": "ITEM"}]))
+
+        assert manager.get_table_info() == [{"TABLE_NAME": "ITEM"}]
+        assert manager.get_table_info() == [{"TABLE_NAME": "ITEM"}]
+        manager.iter_table_info.assert_called_once()
+
+        manager.iter_table_info.return_value = iter([])
+        manager.clear_table_info_cache()
+        assert manager.get_table_info() == []
+
+
+class TestCopySchema:
+    """Test copy_schema round-trips."""
+
+    def test_source_tables_looked_up_once(self):
+        """Test that missing source tables are skipped without extra queries."""
+        cursor = MagicMock()
+        cursor.__iter__.return_value = iter([("ITEM",)])
+        cursor.fetchone.return_value = (3,)
+        manager = _manager_with_cursor(cursor)
+        manager._check_schema_user_exists = Mock(return_value=True)
+
+        assert manager.copy_schema("SRC", "DST", ["item", "store"]) is True
+
+        executed = [c[0][0] for c in cursor.execute.call_args_list]
+        assert executed[0] == (
+            "SELECT table_name FROM all_tables WHERE owner = :owner "
+            "AND table_name IN (:t0, :t1)"
+        )
+        assert cursor.execute.call_args_list[0][0][1] == {
+            "owner": "SRC",
+            "t0": "ITEM",
+            "t1": "STORE",
+        }
+        assert sum("all_tables" in sql for sql in executed) == 1
+        assert "CREATE TABLE DST.ITEM AS SELECT * FROM SRC.ITEM" in executed
+        assert "CREATE TABLE DST.STORE AS SELECT * FROM SRC.STORE" not in executed
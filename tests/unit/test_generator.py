@@ -0,0 +1,32 @@
+"""Unit tests for generator module."""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from tpcds_util.generator import DataGenerator
+
+
+class TestGenerateData:
+    """Test option defaults in generate_data."""
+
+    @pytest.fixture
+    def generator(self, mock_tpcds_config):
+        """DataGenerator whose config default scale differs from any test value."""
+        with patch("tpcds_util.generator.config_manager") as mock_config_manager:
+            mock_config_manager.load.return_value = replace(
+                mock_tpcds_config, default_scale=5
+            )
+            yield DataGenerator()
+
+    @pytest.mark.parametrize("scale, expected", [(None, 5), (0, 0), (2, 2)])
+    @patch("tpcds_util.generator.get_console")
+    @patch("tpcds_util.synthetic_generator.create_synthetic_data")
+    def test_scale_defaults_only_when_omitted(
+        self, mock_create, mock_get_console, generator, scale, expected
+    ):
+        """Test that an explicit scale, even the falsy test-mode 0, is kept."""
+        generator.generate_data(scale=scale, output_dir="/tmp/out")
+
+        mock_create.assert_called_once_with(scale=expected, output_dir="/tmp/out")
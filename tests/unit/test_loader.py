@@ -0,0 +1,36 @@
+"""Unit tests for loader module."""
+
+from unittest.mock import Mock
+
+import oracledb
+
+from tpcds_util.loader import DataLoader
+
+
+class TestInsertBatch:
+    """Test array DML batch inserts."""
+
+    def test_rejected_rows_are_skipped_in_one_round_trip(self):
+        """Test that row errors are collected instead of retried one by one."""
+        cursor = Mock()
+        cursor.getbatcherrors.return_value = [Mock(message="ORA-01722: invalid")]
+        rows = [[1, "a"], ["x", "b"], [3, "c"]]
+
+        inserted = DataLoader()._insert_batch(cursor, "INSERT ...", rows, "item")
+
+        cursor.executemany.assert_called_once_with("INSERT ...", rows, batcherrors=True)
+        cursor.execute.assert_not_called()
+        assert inserted == 2
+
+    def test_failed_batch_falls_back_to_individual_inserts(self):
+        """Test that a whole-call failure salvages the good rows one by one."""
+        cursor = Mock()
+        cursor.executemany.side_effect = oracledb.Error("DPY-3013: unsupported")
+        cursor.execute.side_effect = [None, oracledb.Error("ORA-01722"), None]
+        rows = [[1, "a"], ["x", "b"], [3, "c"]]
+
+        inserted = DataLoader()._insert_batch(cursor, "INSERT ...", rows, "item")
+
+        assert cursor.execute.call_count == 3
+        cursor.getbatcherrors.assert_not_called()
+        assert inserted == 2
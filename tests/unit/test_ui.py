@@ -0,0 +1,11 @@
+"""Unit tests for ui module."""
+
+from tpcds_util import database, loader, ui
+
+
+class TestGetConsole:
+    """Test the shared Rich console."""
+
+    def test_modules_share_one_console(self):
+        """Test that output modules reuse the shared Rich console."""
+        assert database.console is loader.console is ui.get_console()